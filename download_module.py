@@ -12,10 +12,72 @@ import numpy as np
 import rasterio
 from rasterio.transform import from_bounds
 from rasterio.crs import CRS
+from rasterio.windows import Window
+from rasterio.io import MemoryFile
 from io import BytesIO
 from PIL import Image
 import pyproj
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 from PyQt6.QtCore import QThread, pyqtSignal
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Per-thread status callback for retry notices, set by BathymetryDownloader._report_retries
+_retry_report = threading.local()
+
+
+class _ReportingRetry(Retry):
+    """Retry that reports each retry to the status callback of the calling thread's download."""
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # Raises MaxRetryError once the retries are used up; only actual retries are reported
+        new_retry = super().increment(method, url, response=response, error=error,
+                                      _pool=_pool, _stacktrace=_stacktrace)
+        report = getattr(_retry_report, "status", None)
+        if report is not None:
+            reason = f"HTTP {response.status}" if response is not None else type(error).__name__
+            report(f"Server request failed ({reason}), retry {len(new_retry.history)}/{_RETRY_TOTAL}...")
+        return new_retry
+
+
+# Retry transient export failures (rate limiting, gateway errors, dropped connections) with exponential
+# backoff (0.5 s, 1 s, 2 s, ...), honouring Retry-After on 429/503. A 500 is not retried: the server
+# cannot process that request and the downloader reports it right away. Read errors are not retried
+# either: with the 300 s export timeout a stalled export would otherwise block for ~25 minutes.
+_RETRY_TOTAL = 4
+_RETRY = _ReportingRetry(total=_RETRY_TOTAL, read=0, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504))
+
+# Shared across downloads so consecutive exports (and GEBCO multi-output jobs) reuse keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=_RETRY))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=_RETRY))
+
+
+def prewarm_connection(url):
+    """Open a keep-alive connection to url on the shared session (best effort, blocking)."""
+    try:
+        _SESSION.head(url, timeout=5)
+    except requests.RequestException:
+        pass  # The download opens its own connection if this one failed
+
+
+# Rows converted and written per block by _write_geotiff
+_WRITE_BLOCK_ROWS = 512
+
+# 3857 -> 4326 transformer, built once on first use and shared between downloads
+_to_4326 = None
+_to_4326_lock = threading.Lock()
+
+
+def _transform_to_4326(xs, ys):
+    """Transform Web Mercator x/y (scalars or sequences) to GCS lon/lat with the cached transformer."""
+    global _to_4326
+    with _to_4326_lock:
+        if _to_4326 is None:
+            _to_4326 = pyproj.Transformer.from_crs("EPSG:3857", "EPSG:4326", always_xy=True)
+        return _to_4326.transform(xs, ys)
 
 
 class BathymetryDownloader(QThread):
@@ -29,7 +91,7 @@ class BathymetryDownloader(QThread):
     def __init__(self, base_url, bbox, output_path, output_crs="EPSG:3857", 
                  pixel_size=None, max_size=14000, use_tile_download=False,
                  bbox_in_4326=False, pixel_size_degrees=None, tid_url=None, download_mode="combined",
-                 output_requests=None):
+                 output_requests=None, session=None):
         super().__init__()
         self.base_url = base_url
         self.bbox = bbox  # (xmin, ymin, xmax, ymax) in EPSG:3857 or 4326 when bbox_in_4326
@@ -42,7 +104,10 @@ class BathymetryDownloader(QThread):
         self.use_tile_download = use_tile_download
         self.tile_overlap = 5
         self.tile_max_size = 2000
+        self.tile_workers = 4  # Tiles downloaded concurrently in tiled mode
         self.cancelled = False
+        # Caller's session if given, else the module-level keep-alive one (what the app uses)
+        self._session = session if session is not None else _SESSION
         self.tid_url = tid_url  # GEBCO 2025 TID ImageServer URL for bathymetry_only / land_only
         self.download_mode = download_mode  # used when output_requests is None
         # output_requests: list of (mode, path) e.g. [("combined", path1), ("bathymetry_only", path2)]
@@ -62,8 +127,14 @@ class BathymetryDownloader(QThread):
         """Cancel the download."""
         self.cancelled = True
         
+    def _report_retries(self):
+        """Send retry notices from requests made on the calling thread to the status signal."""
+        _retry_report.status = self.status.emit
+        
     def run(self):
         """Download data and create GeoTIFF."""
+        self._report_retries()
+        tid_future = None
         try:
             xmin, ymin, xmax, ymax = self.bbox
             
@@ -93,6 +164,13 @@ class BathymetryDownloader(QThread):
                 self.error.emit(error_msg)
                 return
             
+            # Masked GEBCO 2025 outputs need the TID grid - fetch it in parallel with the main export
+            need_tid = bool(self.output_requests) and any(m in ("bathymetry_only", "land_only", "direct_measurements_only", "direct_unknown_measurements_only") for m, _ in self.output_requests)
+            if need_tid and self.tid_url:
+                tid_executor = ThreadPoolExecutor(max_workers=1)
+                tid_future = tid_executor.submit(self._download_tid_grid, xmin, ymin, xmax, ymax, width, height)
+                tid_executor.shutdown(wait=False)
+            
             # Check if tiling is needed
             needs_tiling = self.use_tile_download and (width > self.tile_max_size or height > self.tile_max_size)
             
@@ -140,7 +218,7 @@ class BathymetryDownloader(QThread):
                 downloaded_crs = None
                 
                 try:
-                    response = requests.get(url, params=params, timeout=300, stream=True)
+                    response = self._session.get(url, params=params, timeout=300, stream=True)
                     
                     # Check for HTTP errors before processing
                     if response.status_code == 500:
@@ -167,7 +245,7 @@ class BathymetryDownloader(QThread):
                     if 'tiff' in content_type.lower() or response.content[:4] == b'II*\x00' or response.content[:4] == b'MM\x00*':
                         # We got a TIFF, try to read it with rasterio
                         try:
-                            with rasterio.open(BytesIO(response.content)) as src:
+                            with MemoryFile(response.content) as mem, mem.open() as src:
                                 # Preserve original data type, especially int16 for GEBCO 2025
                                 original_dtype = src.dtypes[0]
                                 img_array = src.read(1)
@@ -273,7 +351,7 @@ class BathymetryDownloader(QThread):
                     # Fall back to PNG
                     try:
                         params["format"] = "png"
-                        response = requests.get(url, params=params, timeout=300, stream=True)
+                        response = self._session.get(url, params=params, timeout=300, stream=True)
                         response.raise_for_status()
                         
                         img = Image.open(BytesIO(response.content))
@@ -309,13 +387,16 @@ class BathymetryDownloader(QThread):
             
             # Multi-output path (GEBCO 2025: combined + bathymetry_only + land_only + direct_measurements_only)
             if self.output_requests:
-                need_tid = any(m in ("bathymetry_only", "land_only", "direct_measurements_only", "direct_unknown_measurements_only") for m, _ in self.output_requests)
                 tid_array = None
-                if need_tid and self.tid_url:
+                if tid_future is not None:
                     if self.cancelled:
                         return
-                    self.status.emit("Downloading TID grid for masking...")
-                    tid_array = self._fetch_tid_grid(xmin, ymin, xmax, ymax, width, height)
+                    self.status.emit("Waiting for TID grid for masking...")
+                    try:
+                        tid_array = tid_future.result()
+                    except Exception as e:
+                        self.error.emit(f"Failed to fetch TID grid: {str(e)}")
+                        return
                     if tid_array is None:
                         return
                 # Build one array per output (copy + mask)
@@ -347,9 +428,7 @@ class BathymetryDownloader(QThread):
                         output_bbox = self.bbox
                     elif self.output_crs == "EPSG:4326":
                         from rasterio.warp import reproject, Resampling, calculate_default_transform
-                        transformer = pyproj.Transformer.from_crs("EPSG:3857", "EPSG:4326", always_xy=True)
-                        lon_min, lat_min = transformer.transform(xmin, ymin)
-                        lon_max, lat_max = transformer.transform(xmax, ymax)
+                        (lon_min, lon_max), (lat_min, lat_max) = _transform_to_4326((xmin, xmax), (ymin, ymax))
                         output_bbox = (lon_min, lat_min, lon_max, lat_max)
                         crs = CRS.from_epsg(4326)
                         self.status.emit("Reprojecting to WGS84...")
@@ -420,9 +499,7 @@ class BathymetryDownloader(QThread):
                     crs = CRS.from_epsg(3857)
                     output_bbox = self.bbox
                 elif self.output_crs == "EPSG:4326":
-                    transformer = pyproj.Transformer.from_crs("EPSG:3857", "EPSG:4326", always_xy=True)
-                    lon_min, lat_min = transformer.transform(xmin, ymin)
-                    lon_max, lat_max = transformer.transform(xmax, ymax)
+                    (lon_min, lon_max), (lat_min, lat_max) = _transform_to_4326((xmin, xmax), (ymin, ymax))
                     output_bbox = (lon_min, lat_min, lon_max, lat_max)
                     crs = CRS.from_epsg(4326)
                     self.status.emit("Reprojecting to WGS84...")
@@ -483,6 +560,10 @@ class BathymetryDownloader(QThread):
             self.error.emit(f"Error: {str(e)}")
             import traceback
             traceback.print_exc()
+        finally:
+            # Stop an abandoned TID prefetch (main export failed or was cancelled)
+            if tid_future is not None and not tid_future.done():
+                self.cancelled = True
     
     def _write_geotiff(self, img_array, path, width, height, transform, crs, source_nodata=None):
         """Write a single GeoTIFF from an array. Uses self._preserve_int8 / _preserve_int16 for dtype."""
@@ -514,29 +595,45 @@ class BathymetryDownloader(QThread):
                     nodata_value = -32768
                 else:
                     nodata_value = 0.0
-        img_array_for_write = img_array.copy()
-        if np.any(np.isnan(img_array_for_write)):
-            img_array_for_write = np.nan_to_num(img_array_for_write, nan=nodata_value)
-        if preserve_int8:
-            img_array_for_write = np.round(img_array_for_write)
-            img_array_for_write = np.clip(img_array_for_write, -128, 127)
-            img_array_for_write = img_array_for_write.astype(np.int8)
-            nan_mask = np.isnan(img_array)
-            img_array_for_write[nan_mask] = nodata_value
-        elif preserve_int16:
-            img_array_for_write = np.round(img_array_for_write)
-            img_array_for_write = np.clip(img_array_for_write, -32768, 32767)
-            img_array_for_write = img_array_for_write.astype(np.int16)
-            nan_mask = np.isnan(img_array)
-            img_array_for_write[nan_mask] = nodata_value
-        else:
-            if img_array_for_write.dtype != np.float32:
-                img_array_for_write = img_array_for_write.astype(np.float32)
         with rasterio.open(
             path, 'w', driver='GTiff', height=height, width=width, count=1,
             dtype=output_dtype, crs=crs, transform=transform, compress='lzw', nodata=nodata_value
         ) as dst:
-            dst.write(img_array_for_write, 1)
+            # Convert and write in row blocks so the nodata fill, rounding and dtype casts only ever
+            # copy one block instead of the whole grid (several full-size temporaries for large areas).
+            # Writes (LZW compression + disk I/O, GIL released) run on one writer thread while the next
+            # block is converted here; waiting on the previous write keeps at most two blocks in memory.
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                pending_write = None
+                for row in range(0, height, _WRITE_BLOCK_ROWS):
+                    block = img_array[row:row + _WRITE_BLOCK_ROWS]
+                    out = self._to_output_block(block, output_dtype, nodata_value)
+                    if pending_write is not None:
+                        pending_write.result()  # Re-raises a failed write
+                    pending_write = writer.submit(dst.write, out, 1, window=Window(0, row, width, block.shape[0]))
+                if pending_write is not None:
+                    pending_write.result()
+    
+    @staticmethod
+    def _to_output_block(block, output_dtype, nodata_value):
+        """Return a block of the output array converted for writing (NaN -> nodata, rounded/clipped for ints)."""
+        nan_mask = np.isnan(block)
+        if nan_mask.any():
+            block = np.nan_to_num(block, nan=nodata_value)
+        if output_dtype == np.float32:
+            return block.astype(np.float32, copy=False)
+        info = np.iinfo(output_dtype)
+        out = np.clip(np.round(block), info.min, info.max).astype(output_dtype)
+        out[nan_mask] = nodata_value
+        return out
+    
+    @staticmethod
+    def _tile_axis(total, tile_size, overlap):
+        """Return (start, end, overlap_start, overlap_end) pixel arrays for the tiles along one axis."""
+        start = np.arange(0, total, tile_size)
+        end = np.minimum(start + tile_size, total)
+        # Extend each tile by the overlap (clamped to the image) to ensure no gaps
+        return start, end, np.maximum(0, start - overlap), np.minimum(total, end + overlap)
     
     def _download_tiled(self, xmin, ymin, xmax, ymax, total_width, total_height):
         """Download data in tiles and reassemble.
@@ -564,107 +661,91 @@ class BathymetryDownloader(QThread):
         transform = None
         downloaded_crs = None
         
-        tile_num = 0
+        # Build the tile jobs: output region (without overlap) and request params (with overlap).
+        # The grid is separable, so pixel bounds and world bounds are computed once per column/row.
+        col_start, col_end, col_ov_start, col_ov_end = self._tile_axis(total_width, self.tile_max_size, self.tile_overlap)
+        row_start, row_end, row_ov_start, row_ov_end = self._tile_axis(total_height, self.tile_max_size, self.tile_overlap)
+        col_xmin = (xmin + col_ov_start * pixel_size_x).tolist()
+        col_xmax = (xmin + col_ov_end * pixel_size_x).tolist()
+        row_ymin = (ymin + (total_height - row_ov_end) * pixel_size_y).tolist()  # Y is inverted
+        row_ymax = (ymin + (total_height - row_ov_start) * pixel_size_y).tolist()
+        col_width = (col_ov_end - col_ov_start).tolist()
+        row_height = (row_ov_end - row_ov_start).tolist()
+        col_start, col_end, col_ov_start = col_start.tolist(), col_end.tolist(), col_ov_start.tolist()
+        row_start, row_end, row_ov_start = row_start.tolist(), row_end.tolist(), row_ov_start.tolist()
         
-        for tile_y in range(tiles_y):
-            for tile_x in range(tiles_x):
-                if self.cancelled:
-                    return None, None, None, None
-                
-                tile_num += 1
-                progress = 10 + int(80 * tile_num / total_tiles)
-                self.progress.emit(progress)
-                self.status.emit(f"Downloading tile {tile_num}/{total_tiles}...")
-                
-                # Calculate tile bounds in pixels
-                # Add overlap to ensure no gaps
-                tile_start_x = tile_x * self.tile_max_size
-                tile_start_y = tile_y * self.tile_max_size
-                tile_end_x = min(tile_start_x + self.tile_max_size, total_width)
-                tile_end_y = min(tile_start_y + self.tile_max_size, total_height)
-                
-                # Add overlap (extend bounds)
-                overlap_start_x = max(0, tile_start_x - self.tile_overlap)
-                overlap_start_y = max(0, tile_start_y - self.tile_overlap)
-                overlap_end_x = min(total_width, tile_end_x + self.tile_overlap)
-                overlap_end_y = min(total_height, tile_end_y + self.tile_overlap)
-                
-                # Calculate world bounds for this tile
-                tile_xmin = xmin + overlap_start_x * pixel_size_x
-                tile_ymin = ymin + (total_height - overlap_end_y) * pixel_size_y  # Y is inverted
-                tile_xmax = xmin + overlap_end_x * pixel_size_x
-                tile_ymax = ymin + (total_height - overlap_start_y) * pixel_size_y
-                
-                tile_width = overlap_end_x - overlap_start_x
-                tile_height = overlap_end_y - overlap_start_y
-                
-                # Download this tile
-                url = f"{self.base_url}/exportImage"
+        url = f"{self.base_url}/exportImage"
+        jobs = []
+        for ty in range(tiles_y):
+            for tx in range(tiles_x):
                 params = {
-                    "bbox": f"{tile_xmin},{tile_ymin},{tile_xmax},{tile_ymax}",
-                    "size": f"{tile_width},{tile_height}",
+                    "bbox": f"{col_xmin[tx]},{row_ymin[ty]},{col_xmax[tx]},{row_ymax[ty]}",
+                    "size": f"{col_width[tx]},{row_height[ty]}",
                     "format": "tiff",
                     "f": "image",
                     "noData": "true",
                     "interpolation": "RSP_BilinearInterpolation"
                 }
+                jobs.append((col_start[tx], row_start[ty], col_end[tx], row_end[ty],
+                             col_ov_start[tx], row_ov_start[ty], params))
+        
+        # Tiles are downloaded and decoded by tile_workers threads over the shared keep-alive session,
+        # but merged here in tile order (overlap averaging stays deterministic). At most
+        # 2 * tile_workers tiles are requested ahead of the merge so memory stays bounded.
+        executor = ThreadPoolExecutor(max_workers=self.tile_workers)
+        pending = deque()
+        next_job = 0
+        try:
+            for tile_num, job in enumerate(jobs, 1):
+                if self.cancelled:
+                    return None, None, None, None
+                
+                while next_job < total_tiles and len(pending) < 2 * self.tile_workers:
+                    pending.append(executor.submit(self._fetch_tile, url, jobs[next_job][6]))
+                    next_job += 1
+                
+                self.status.emit(f"Downloading tile {tile_num}/{total_tiles}...")
+                tile_start_x, tile_start_y, tile_end_x, tile_end_y, overlap_start_x, overlap_start_y, _ = job
                 
                 try:
-                    response = requests.get(url, params=params, timeout=300, stream=True)
+                    result = pending.popleft().result()
                     
-                    if response.status_code == 500:
+                    if result is None:
                         error_msg = f"Server error (500) downloading tile {tile_num}/{total_tiles}"
                         self.error.emit(error_msg)
                         return None, None, None, None
                     
-                    response.raise_for_status()
+                    tile_array, tiff_info = result
                     
-                    # Read tile data
-                    tile_array = None
-                    content_type = response.headers.get('Content-Type', '')
-                    
-                    if 'tiff' in content_type.lower() or response.content[:4] == b'II*\x00' or response.content[:4] == b'MM\x00*':
-                        try:
-                            with rasterio.open(BytesIO(response.content)) as src:
-                                # Preserve original data type, especially int16 for GEBCO 2025
-                                original_dtype = src.dtypes[0]
-                                tile_array = src.read(1)
-                                
-                                if src.nodata is not None and source_nodata is None:
-                                    source_nodata = src.nodata
-                                    # For GEBCO 2025 (int16/int8), ignore nodata=0 since 0 is a valid value
-                                    if (self._preserve_int16 or self._preserve_int8) and source_nodata == 0:
-                                        source_nodata = None
-                                
-                                # Handle nodata based on data type
-                                if np.issubdtype(tile_array.dtype, np.integer):
-                                    # For integer types, convert to float32 for NaN handling
-                                    tile_array = tile_array.astype(np.float32)
-                                    # Only mask nodata if it's not None and not 0 (for GEBCO 2025)
-                                    if source_nodata is not None and source_nodata != 0:
-                                        tile_array = np.where(tile_array == source_nodata, np.nan, tile_array)
-                                    # Track if we should preserve int8/int16 (only if not already set)
-                                    if not self._preserve_int8 and not self._preserve_int16:
-                                        self._preserve_int8 = (original_dtype == np.int8)
-                                        self._preserve_int16 = (original_dtype == np.int16)
-                                else:
-                                    # For float arrays, use NaN directly (only if nodata is not None and not 0)
-                                    if source_nodata is not None and source_nodata != 0:
-                                        tile_array = np.where(tile_array == source_nodata, np.nan, tile_array)
-                                
-                                if transform is None and hasattr(src, 'transform') and src.transform:
-                                    transform = src.transform
-                                if downloaded_crs is None and hasattr(src, 'crs') and src.crs:
-                                    downloaded_crs = src.crs
-                        except Exception:
-                            img = Image.open(BytesIO(response.content))
-                            tile_array = np.array(img, dtype=np.float32)
-                    else:
-                        img = Image.open(BytesIO(response.content))
-                        if img.mode in ('RGB', 'RGBA'):
-                            tile_array = np.array(img.convert('L'), dtype=np.float32)
+                    if tiff_info is not None:
+                        original_dtype, tile_nodata, tile_transform, tile_crs = tiff_info
+                        
+                        if tile_nodata is not None and source_nodata is None:
+                            source_nodata = tile_nodata
+                            # For GEBCO 2025 (int16/int8), ignore nodata=0 since 0 is a valid value
+                            if (self._preserve_int16 or self._preserve_int8) and source_nodata == 0:
+                                source_nodata = None
+                        
+                        # Handle nodata based on data type
+                        if np.issubdtype(tile_array.dtype, np.integer):
+                            # For integer types, convert to float32 for NaN handling
+                            tile_array = tile_array.astype(np.float32)
+                            # Only mask nodata if it's not None and not 0 (for GEBCO 2025)
+                            if source_nodata is not None and source_nodata != 0:
+                                tile_array = np.where(tile_array == source_nodata, np.nan, tile_array)
+                            # Track if we should preserve int8/int16 (only if not already set)
+                            if not self._preserve_int8 and not self._preserve_int16:
+                                self._preserve_int8 = (original_dtype == np.int8)
+                                self._preserve_int16 = (original_dtype == np.int16)
                         else:
-                            tile_array = np.array(img, dtype=np.float32)
+                            # For float arrays, use NaN directly (only if nodata is not None and not 0)
+                            if source_nodata is not None and source_nodata != 0:
+                                tile_array = np.where(tile_array == source_nodata, np.nan, tile_array)
+                        
+                        if transform is None and tile_transform:
+                            transform = tile_transform
+                        if downloaded_crs is None and tile_crs:
+                            downloaded_crs = tile_crs
                     
                     # Determine where to place this tile in the output array
                     # Account for overlap - use the non-overlap region for placement
@@ -716,6 +797,13 @@ class BathymetryDownloader(QThread):
                     error_msg = f"Error downloading tile {tile_num}/{total_tiles}: {str(e)}"
                     self.error.emit(error_msg)
                     return None, None, None, None
+                
+                self.progress.emit(10 + int(80 * tile_num / total_tiles))
+        finally:
+            # Cancelled or failed: drop queued tiles and don't wait for the ones in flight
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
         
         self.progress.emit(90)
         self.status.emit("Reassembling tiles...")
@@ -736,8 +824,46 @@ class BathymetryDownloader(QThread):
         
         return img_array, source_nodata, transform, downloaded_crs
     
+    def _fetch_tile(self, url, params):
+        """Download and decode one exportImage tile (runs on a tile worker thread).
+        
+        Returns:
+            tuple: (tile_array, tiff_info) where tiff_info is (dtype, nodata, transform, crs) for a
+            GeoTIFF reply and None for an image decoded with PIL, or None on a server error (500)
+        """
+        self._report_retries()
+        # Closed on exit, so an error reply hands its pooled connection straight back to the other workers
+        with self._session.get(url, params=params, timeout=300) as response:
+            if response.status_code == 500:
+                return None
+            response.raise_for_status()
+            content = response.content
+            content_type = response.headers.get('Content-Type', '')
+        
+        if 'tiff' in content_type.lower() or content[:4] == b'II*\x00' or content[:4] == b'MM\x00*':
+            try:
+                with MemoryFile(content) as mem, mem.open() as src:
+                    # Preserve original data type, especially int16 for GEBCO 2025
+                    return src.read(1), (src.dtypes[0], src.nodata, src.transform, src.crs)
+            except Exception:
+                img = Image.open(BytesIO(content))
+                return np.array(img, dtype=np.float32), None
+        img = Image.open(BytesIO(content))
+        if img.mode in ('RGB', 'RGBA'):
+            return np.array(img.convert('L'), dtype=np.float32), None
+        return np.array(img, dtype=np.float32), None
+    
     def _fetch_tid_grid(self, xmin, ymin, xmax, ymax, width, height):
         """Fetch TID grid from TID ImageServer (same bbox and size). Returns 2D array (int8 or float32) or None on error."""
+        try:
+            return self._download_tid_grid(xmin, ymin, xmax, ymax, width, height)
+        except Exception as e:
+            self.error.emit(f"Failed to fetch TID grid: {str(e)}")
+            return None
+    
+    def _download_tid_grid(self, xmin, ymin, xmax, ymax, width, height):
+        """Download the TID grid; raises on network/decode errors and returns None if cancelled."""
+        self._report_retries()
         url = f"{self.tid_url.rstrip('/')}/exportImage"
         params = {
             "bbox": f"{xmin},{ymin},{xmax},{ymax}",
@@ -747,53 +873,48 @@ class BathymetryDownloader(QThread):
             "noData": "true",
             "interpolation": "RSP_BilinearInterpolation"
         }
-        try:
-            if width <= self.tile_max_size and height <= self.tile_max_size:
-                response = requests.get(url, params=params, timeout=300, stream=True)
-                response.raise_for_status()
-                content_type = response.headers.get('Content-Type', '')
-                if 'tiff' in content_type.lower() or response.content[:4] in (b'II*\x00', b'MM\x00*'):
-                    with rasterio.open(BytesIO(response.content)) as src:
-                        arr = src.read(1)
-                        if np.issubdtype(arr.dtype, np.integer):
-                            return arr  # Keep int8 for tid == 0 comparison
-                        return arr.astype(np.float32)
-                else:
-                    img = Image.open(BytesIO(response.content))
-                    return np.array(img.convert('L') if img.mode in ('RGB', 'RGBA') else img, dtype=np.float32)
+        if width <= self.tile_max_size and height <= self.tile_max_size:
+            response = self._session.get(url, params=params, timeout=300, stream=True)
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', '')
+            if 'tiff' in content_type.lower() or response.content[:4] in (b'II*\x00', b'MM\x00*'):
+                with MemoryFile(response.content) as mem, mem.open() as src:
+                    arr = src.read(1)
+                    if np.issubdtype(arr.dtype, np.integer):
+                        return arr  # Keep int8 for tid == 0 comparison
+                    return arr.astype(np.float32)
             else:
-                # Tiled fetch for large areas
-                tiles_x = int(np.ceil(width / self.tile_max_size))
-                tiles_y = int(np.ceil(height / self.tile_max_size))
-                pixel_size_x = (xmax - xmin) / width
-                pixel_size_y = (ymax - ymin) / height
-                out = np.full((height, width), -128, dtype=np.int8)  # TID nodata-like fill
-                for tile_y in range(tiles_y):
-                    for tile_x in range(tiles_x):
-                        if self.cancelled:
-                            return None
-                        tx0 = tile_x * self.tile_max_size
-                        ty0 = tile_y * self.tile_max_size
-                        tx1 = min(tx0 + self.tile_max_size, width)
-                        ty1 = min(ty0 + self.tile_max_size, height)
-                        bx0 = xmin + tx0 * pixel_size_x
-                        bx1 = xmin + tx1 * pixel_size_x
-                        # Image row 0 = north (ymax), row increases southward
-                        by0 = ymax - ty0 * pixel_size_y  # north
-                        by1 = ymax - ty1 * pixel_size_y  # south
-                        tw, th = tx1 - tx0, ty1 - ty0
-                        resp = requests.get(url, params={
-                            "bbox": f"{bx0},{by0},{bx1},{by1}",
-                            "size": f"{tw},{th}",
-                            "format": "tiff", "f": "image", "noData": "true",
-                            "interpolation": "RSP_BilinearInterpolation"
-                        }, timeout=300, stream=True)
-                        resp.raise_for_status()
-                        with rasterio.open(BytesIO(resp.content)) as src:
-                            tile = src.read(1)
-                        out[ty0:ty1, tx0:tx1] = tile[:th, :tw]
-                return out
-        except Exception as e:
-            self.error.emit(f"Failed to fetch TID grid: {str(e)}")
-            return None
-
+                img = Image.open(BytesIO(response.content))
+                return np.array(img.convert('L') if img.mode in ('RGB', 'RGBA') else img, dtype=np.float32)
+        else:
+            # Tiled fetch for large areas
+            tiles_x = int(np.ceil(width / self.tile_max_size))
+            tiles_y = int(np.ceil(height / self.tile_max_size))
+            pixel_size_x = (xmax - xmin) / width
+            pixel_size_y = (ymax - ymin) / height
+            out = np.full((height, width), -128, dtype=np.int8)  # TID nodata-like fill
+            for tile_y in range(tiles_y):
+                for tile_x in range(tiles_x):
+                    if self.cancelled:
+                        return None
+                    tx0 = tile_x * self.tile_max_size
+                    ty0 = tile_y * self.tile_max_size
+                    tx1 = min(tx0 + self.tile_max_size, width)
+                    ty1 = min(ty0 + self.tile_max_size, height)
+                    bx0 = xmin + tx0 * pixel_size_x
+                    bx1 = xmin + tx1 * pixel_size_x
+                    # Image row 0 = north (ymax), row increases southward
+                    by0 = ymax - ty0 * pixel_size_y  # north
+                    by1 = ymax - ty1 * pixel_size_y  # south
+                    tw, th = tx1 - tx0, ty1 - ty0
+                    resp = self._session.get(url, params={
+                        "bbox": f"{bx0},{by0},{bx1},{by1}",
+                        "size": f"{tw},{th}",
+                        "format": "tiff", "f": "image", "noData": "true",
+                        "interpolation": "RSP_BilinearInterpolation"
+                    }, timeout=300, stream=True)
+                    resp.raise_for_status()
+                    with MemoryFile(resp.content) as mem, mem.open() as src:
+                        tile = src.read(1)
+                    out[ty0:ty1, tx0:tx1] = tile[:th, :tw]
+            return out
@@ -37,24 +37,34 @@ __version__ = "2026.05" #  Fixed a timeout issue
 import sys
 import os
 
-# Set PROJ_LIB and PROJ_DATA for PyInstaller builds so pyproj/rasterio find proj.db
-if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-    proj_data_path = os.path.join(sys._MEIPASS, 'proj')
-    if os.path.exists(proj_data_path):
-        os.environ['PROJ_LIB'] = proj_data_path
-        os.environ['PROJ_DATA'] = proj_data_path
-
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QGridLayout, QLabel, QLineEdit, QPushButton, 
                              QFileDialog, QComboBox, QProgressBar, QTextEdit,
                              QGroupBox, QMessageBox, QCheckBox, QSizePolicy, QStyleFactory)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl
-from PyQt6.QtGui import QDesktopServices, QMouseEvent, QPalette, QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QUrl, QSignalBlocker, QLocale, QFileSystemWatcher
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PyQt6.QtGui import QDesktopServices, QMouseEvent, QPalette, QColor, QFont, QDoubleValidator, QImage, QPainter
 from map_widget import MapWidget
-from download_module import BathymetryDownloader
-import requests
 import json
+import math
+import traceback
+import threading
 from datetime import datetime
+from dataclasses import dataclass
+from collections import deque
+from pathlib import Path
+try:
+    import orjson  # Optional faster JSON codec for the config file
+except ImportError:
+    orjson = None
+
+# Short names used in GEBCO 2025 output filenames (modes not listed use their own name)
+_MODE_SHORT_NAME = {
+    "bathymetry_only": "bathymetry",
+    "land_only": "land",
+    "direct_measurements_only": "direct",
+    "direct_unknown_measurements_only": "direct_unknown",
+}
 
 
 class ClickableLabel(QLabel):
@@ -68,59 +78,51 @@ class ClickableLabel(QLabel):
         super().mousePressEvent(event)
 
 
-class ServiceInfoLoader(QThread):
-    """Thread for loading service information asynchronously."""
-    loaded = pyqtSignal(dict)  # Emits extent dict and raster functions
-    error = pyqtSignal(str)  # Emits error message
+def _parse_service_info(data):
+    """Extract extent, raster function names and pixel size from an ImageServer ?f=json document."""
+    # Extract extent
+    extent = data.get("extent", {})
+    extent_dict = {
+        "xmin": extent.get("xmin", -8254538.5),
+        "ymin": extent.get("ymin", 4898563.25),
+        "xmax": extent.get("xmax", -7411670.5),
+        "ymax": extent.get("ymax", 5636075.25)
+    }
     
-    def __init__(self, base_url):
-        super().__init__()
-        self.base_url = base_url
-        
-    def run(self):
-        """Load service information from REST endpoint."""
-        try:
-            url = f"{self.base_url}?f=json"
-            response = requests.get(url, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Extract extent
-            extent = data.get("extent", {})
-            extent_dict = {
-                "xmin": extent.get("xmin", -8254538.5),
-                "ymin": extent.get("ymin", 4898563.25),
-                "xmax": extent.get("xmax", -7411670.5),
-                "ymax": extent.get("ymax", 5636075.25)
-            }
-            
-            # Extract raster functions
-            raster_functions = ["None"]  # Always include "None" option
-            raster_function_infos = data.get("rasterFunctionInfos", [])
-            for rf_info in raster_function_infos:
-                name = rf_info.get("name", "")
-                if name and name != "None":
-                    raster_functions.append(name)
-            
-            # Extract pixel size
-            pixel_size_x = data.get("pixelSizeX", None)
-            pixel_size_y = data.get("pixelSizeY", None)
-            
-            result = {
-                "extent": extent_dict,
-                "raster_functions": raster_functions,
-                "pixel_size_x": pixel_size_x,
-                "pixel_size_y": pixel_size_y
-            }
-            
-            self.loaded.emit(result)
-            
-        except requests.exceptions.Timeout:
-            self.error.emit("Connection timeout. Using default extent.")
-        except requests.exceptions.RequestException as e:
-            self.error.emit(f"Network error connecting to REST endpoint: {str(e)}. Using default extent.")
-        except Exception as e:
-            self.error.emit(f"Error loading service info: {str(e)}. Using default extent.")
+    # Extract raster functions
+    # Deduplicated and sorted for a stable order; "None" is always offered first
+    names = {rf_info.get("name", "") for rf_info in data.get("rasterFunctionInfos", [])}
+    names.discard("")
+    names.discard("None")
+    raster_functions = ["None", *sorted(names)]
+    
+    # Extract pixel size
+    pixel_size_x = data.get("pixelSizeX", None)
+    pixel_size_y = data.get("pixelSizeY", None)
+    
+    return {
+        "extent": extent_dict,
+        "raster_functions": raster_functions,
+        "pixel_size_x": pixel_size_x,
+        "pixel_size_y": pixel_size_y
+    }
+
+
+@dataclass(frozen=True)
+class DataSource:
+    """Static configuration of one selectable data source (immutable, safe to share with worker threads)."""
+    url: str  # ImageServer REST endpoint used for service info and downloads
+    bathymetry_raster_function: str
+    hillshade_raster_function: str
+    default_extent: tuple  # (west, south, east, north) fallback until service info loads
+    display_url: str = None  # MapServer used for on-screen display (GCS)
+    land_display_url: str = None  # MapServer drawn underneath display_url for land areas
+    service_crs: str = "EPSG:4326"
+    native_resolution_only: bool = False
+    native_pixel_size_degrees: float = None
+    overview_pixel_sizes_degrees: tuple = ()  # Native cell size and its overview levels
+    attribution: str = ""
+    attribution_url: str = ""
 
 
 class MainWindow(QMainWindow):
@@ -131,50 +133,121 @@ class MainWindow(QMainWindow):
         # Data source configurations
         # GEBCO 2025: everything in GCS (EPSG:4326), full extent to poles
         _world_4326 = (-180.0, -90.0, 180.0, 90.0)
+        _native_deg = 0.004166666666666667  # GEBCO 2025 native cell size (15 arc-seconds)
+        # Native cell size and its power-of-two overview levels (for "Match Screen Resolution")
+        _overviews = tuple(_native_deg * 2 ** level for level in range(6))
+        _gebco_attribution = "GEBCO Compilation Group (2025) GEBCO 2025 Grid (doi:10.5285/37c52e96-24ea-67ce-e063-7086abc05f29)"
+        _gebco_attribution_url = "https://www.bodc.ac.uk/data/published_data_library/catalogue/10.5285/37c52e96-24ea-67ce-e063-7086abc05f29"
         self.data_sources = {
-            "GEBCO 2025": {
-                "url": "https://gis.ccom.unh.edu/server/rest/services/GEBCO2025/GEBCO_2025_IS/ImageServer",
-                "display_url": "https://gis.ccom.unh.edu/server/rest/services/GEBCO/GEBCO_2025_Depths_Haxby_GCS/MapServer",
-                "land_display_url": "https://gis.ccom.unh.edu/server/rest/services/GEBCO/GEBCO_2025_Land_Grey_GCS/MapServer",
-                "bathymetry_raster_function": "None",
-                "hillshade_raster_function": "None",
-                "default_extent": _world_4326,
-                "service_crs": "EPSG:4326",
-                "native_resolution_only": True,
-                "native_pixel_size_degrees": 0.004166666666666667,
-                "attribution": "GEBCO Compilation Group (2025) GEBCO 2025 Grid (doi:10.5285/37c52e96-24ea-67ce-e063-7086abc05f29)",
-                "attribution_url": "https://www.bodc.ac.uk/data/published_data_library/catalogue/10.5285/37c52e96-24ea-67ce-e063-7086abc05f29",
-            },
-            "GEBCO 2025 TID": {
-                "url": "https://gis.ccom.unh.edu/server/rest/services/GEBCO2025/GEBCO_2025_TID_IS/ImageServer",
-                "display_url": "https://gis.ccom.unh.edu/server/rest/services/GEBCO/GEBCO_2025_TID_GCS/MapServer",
-                "land_display_url": "https://gis.ccom.unh.edu/server/rest/services/GEBCO/GEBCO_2025_Land_Grey_GCS/MapServer",
-                "bathymetry_raster_function": "None",
-                "hillshade_raster_function": "None",
-                "default_extent": _world_4326,
-                "service_crs": "EPSG:4326",
-                "native_resolution_only": True,
-                "native_pixel_size_degrees": 0.004166666666666667,
-                "attribution": "GEBCO Compilation Group (2025) GEBCO 2025 Grid (doi:10.5285/37c52e96-24ea-67ce-e063-7086abc05f29)",
-                "attribution_url": "https://www.bodc.ac.uk/data/published_data_library/catalogue/10.5285/37c52e96-24ea-67ce-e063-7086abc05f29",
-            }
+            "GEBCO 2025": DataSource(
+                url="https://gis.ccom.unh.edu/server/rest/services/GEBCO2025/GEBCO_2025_IS/ImageServer",
+                display_url="https://gis.ccom.unh.edu/server/rest/services/GEBCO/GEBCO_2025_Depths_Haxby_GCS/MapServer",
+                land_display_url="https://gis.ccom.unh.edu/server/rest/services/GEBCO/GEBCO_2025_Land_Grey_GCS/MapServer",
+                bathymetry_raster_function="None",
+                hillshade_raster_function="None",
+                default_extent=_world_4326,
+                service_crs="EPSG:4326",
+                native_resolution_only=True,
+                native_pixel_size_degrees=_native_deg,
+                overview_pixel_sizes_degrees=_overviews,
+                attribution=_gebco_attribution,
+                attribution_url=_gebco_attribution_url,
+            ),
+            "GEBCO 2025 TID": DataSource(
+                url="https://gis.ccom.unh.edu/server/rest/services/GEBCO2025/GEBCO_2025_TID_IS/ImageServer",
+                display_url="https://gis.ccom.unh.edu/server/rest/services/GEBCO/GEBCO_2025_TID_GCS/MapServer",
+                land_display_url="https://gis.ccom.unh.edu/server/rest/services/GEBCO/GEBCO_2025_Land_Grey_GCS/MapServer",
+                bathymetry_raster_function="None",
+                hillshade_raster_function="None",
+                default_extent=_world_4326,
+                service_crs="EPSG:4326",
+                native_resolution_only=True,
+                native_pixel_size_degrees=_native_deg,
+                overview_pixel_sizes_degrees=_overviews,
+                attribution=_gebco_attribution,
+                attribution_url=_gebco_attribution_url,
+            ),
         }
         self.current_data_source = "GEBCO 2025"
-        self.base_url = self.data_sources[self.current_data_source]["url"]
+        self.base_url = self.data_sources[self.current_data_source].url
         # Use known extent as fallback (will be updated when service info loads)
-        self.service_extent = self.data_sources[self.current_data_source]["default_extent"]
+        self.service_extent = self.data_sources[self.current_data_source].default_extent
         self.pixel_size_x = None  # Pixel size in X direction from service
         self.pixel_size_y = None  # Pixel size in Y direction from service
         self.downloader = None
-        self.service_loader = None
+        self._service_reply = None  # In-flight service info QNetworkReply
+        # Non-blocking service info requests on the event loop (keep-alive pooled by Qt)
+        self._qnam = QNetworkAccessManager(self)
+        self._qnam.setTransferTimeout(15000)
+        self._svc_cache = None  # Service info cache, read from _svc_cache_path on first use
         self._updating_coordinates = False  # Flag to prevent recursive updates
         self.output_directory = None  # Store selected output directory
+        self._output_directory_valid = False  # Cached os.path.isdir(output_directory)
+        # Invalidate the cached validity if the output directory is removed or renamed
+        self._output_dir_watcher = QFileSystemWatcher(self)
+        self._output_dir_watcher.directoryChanged.connect(self._on_output_directory_changed)
         self.config_file = "worldbathy_downloader_config.json"  # Config file path
+        # Service info cache (conditional GET validators + parsed result) next to the config file
+        self._prefetched_service_info = {}  # {url: result} of this session's service info, for instant switches
+        self._svc_cache_path = os.path.join(os.path.dirname(self.config_file), "service_cache.json")
+        # Delayed zoom to the service extent; one timer so a newer data source switch replaces a pending zoom
+        self._service_zoom_timer = QTimer(self)
+        self._service_zoom_timer.setSingleShot(True)
+        self._service_zoom_timer.setInterval(300)
+        self._service_zoom_timer.timeout.connect(lambda: self.zoom_to_selection(*self.service_extent))
+        # Debounced config writes (see _schedule_config_save)
+        self._config_save_timer = QTimer(self)
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.setInterval(500)
+        self._config_save_timer.timeout.connect(self.save_config)
+        # Debounced map refresh after window resizes (see resizeEvent)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(300)
+        self._resize_timer.timeout.connect(self._refresh_map_on_resize)
         self._data_source_changing = False  # Flag to track when data source is changing
+        self._last_service_digest = None  # Hash of the last service info applied in on_service_info_loaded
+        self._prewarmed_url = None  # Service URL the download session last opened a connection to
+        self._svc_err_msgbox = None  # Connection error dialog, built on first use and reused
+        self._warn_msgbox = None  # Warning/error dialog reused by _warn
+        self._large_warning_msgbox = None  # Large Dataset Warning dialog, built on first use and reused
+        self._last_progress = 0  # Latest downloader progress, pushed to the progress bar by _progress_timer
+        self._last_status = None  # Latest downloader status text not yet shown in status_label
+        # Repaint the progress bar/status label at most 10 times per second during downloads
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._flush_download_progress)
+        # Log lines are buffered and appended in one batch (see _flush_log) so bursts cost one repaint
+        self._log_buf = deque(maxlen=1000)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._verbose_log = False  # Show debug-level log messages (config: verbose_log)
+        self._pixel_count_text = "Pixels: --"  # Text/style last applied to pixel_count_label
+        self._pixel_count_large = False
+        self._pixel_dims_cache = None  # (key, (pixels_width, pixels_height, cell_size_label)) of last pixel count
+        self._last_render_key = None  # (widget_width, widget_height, extent) of the last resize refresh
+        self.selected_bbox = None  # (west, south, east, north) in GCS (4326)
+        self._pending_selection = None  # Selection to restore after a data source switch
+        self._current_attribution_url = None  # Store current attribution URL
+        
+        # Widgets that helpers check before init_ui has built them (None until then)
+        self.map_group = None
+        self.legend_checkbox = None
+        self.download_btn = None
+        self.check_combined = None
+        self.cell_size_combo = None
+        self.cell_size_label = None
+        self.match_screen_checkbox = None
+        self.output_dir_edit = None
+        self.output_data_types_group = None
+        self.attribution_label = None
         
         self.init_ui()
         self.load_config()  # Load saved output directory
         self.load_service_info()
+        self.prefetch_service_info()
         
     def init_ui(self):
         """Initialize the user interface."""
@@ -228,9 +301,9 @@ class MainWindow(QMainWindow):
         map_layout.addLayout(map_controls)
         
         # Map widget (will be created after service info is loaded)
+        # The group box title shows the loading state until init_map_widget creates it
         self.map_widget = None
-        self.loading_label = QLabel("Loading service info...")
-        map_layout.addWidget(self.loading_label)
+        self.map_group.setTitle("Map - loading...")
         
         self.map_group.setLayout(map_layout)
         
@@ -292,36 +365,28 @@ class MainWindow(QMainWindow):
         self.north_edit = QLineEdit()
         self.north_edit.setPlaceholderText("North")
         
-        # Connect GCS field changes to update map
-        self.west_edit.editingFinished.connect(self.on_geographic_changed)
-        self.south_edit.editingFinished.connect(self.on_geographic_changed)
-        self.east_edit.editingFinished.connect(self.on_geographic_changed)
-        self.north_edit.editingFinished.connect(self.on_geographic_changed)
-        
-        # Layout in "+" shape (3x3 grid):
-        # Row 0, Col 1: North (top center)
-        north_layout = QHBoxLayout()
-        north_layout.addWidget(QLabel("North:"))
-        north_layout.addWidget(self.north_edit)
-        selection_main_layout.addLayout(north_layout, 0, 1)
-        
-        # Row 1, Col 0: West (middle left)
-        west_layout = QHBoxLayout()
-        west_layout.addWidget(QLabel("West:"))
-        west_layout.addWidget(self.west_edit)
-        selection_main_layout.addLayout(west_layout, 1, 0)
-        
-        # Row 1, Col 2: East (middle right)
-        east_layout = QHBoxLayout()
-        east_layout.addWidget(QLabel("East:"))
-        east_layout.addWidget(self.east_edit)
-        selection_main_layout.addLayout(east_layout, 1, 2)
-        
-        # Row 2, Col 1: South (bottom center)
-        south_layout = QHBoxLayout()
-        south_layout.addWidget(QLabel("South:"))
-        south_layout.addWidget(self.south_edit)
-        selection_main_layout.addLayout(south_layout, 2, 1)
+        # Only accept numeric degrees (C locale so '.' is always the decimal separator)
+        for edit, limit in ((self.west_edit, 180.0), (self.east_edit, 180.0),
+                            (self.south_edit, 90.0), (self.north_edit, 90.0)):
+            validator = QDoubleValidator(-limit, limit, 6, edit)
+            validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+            validator.setLocale(QLocale.c())
+            edit.setValidator(validator)
+        
+        # Connect GCS field changes to update map (editingFinished only fires for acceptable input)
+        # Edits are debounced so tabbing through several fields applies a single update
+        self._coord_debounce = QTimer(self)
+        self._coord_debounce.setSingleShot(True)
+        self._coord_debounce.setInterval(75)
+        self._coord_debounce.timeout.connect(self.on_geographic_changed)
+        for edit in (self.west_edit, self.south_edit, self.east_edit, self.north_edit):
+            edit.editingFinished.connect(self._coord_debounce.start)
+        
+        # Layout in "+" shape (3x3 grid): North top center, West middle left,
+        # East middle right, South bottom center
+        for label, edit, row, col in (("North:", self.north_edit, 0, 1), ("West:", self.west_edit, 1, 0),
+                                      ("East:", self.east_edit, 1, 2), ("South:", self.south_edit, 2, 1)):
+            selection_main_layout.addLayout(self._labeled_row(label, edit), row, col)
         
         selection_group.setLayout(selection_main_layout)
         right_layout.addWidget(selection_group)
@@ -393,6 +458,12 @@ class MainWindow(QMainWindow):
         self.download_btn = QPushButton("Download Selected Area")
         self.download_btn.clicked.connect(self.start_download)
         self.download_btn.setEnabled(False)
+        # Prebuilt fonts so bold state changes don't copy/reapply the font on every update
+        self._btn_font_normal = QFont(self.download_btn.font())
+        self._btn_font_normal.setBold(False)
+        self._btn_font_bold = QFont(self.download_btn.font())
+        self._btn_font_bold.setBold(True)
+        self._btn_is_bold = self.download_btn.font().bold()
         button_layout.addWidget(self.download_btn)
         
         self.export_image_btn = QPushButton("Export Image")
@@ -406,6 +477,13 @@ class MainWindow(QMainWindow):
         self.tile_download_checkbox.setChecked(True)  # On by default
         right_layout.addWidget(self.tile_download_checkbox)
         
+        # Match screen resolution checkbox (download at the overview level closest to the map view)
+        self.match_screen_checkbox = QCheckBox("Match Screen Resolution")
+        self.match_screen_checkbox.setChecked(False)  # Off by default - download native resolution
+        self.match_screen_checkbox.setToolTip("Download at the coarsest overview level that is still at least as fine as the current map view")
+        self.match_screen_checkbox.toggled.connect(self.on_match_screen_toggled)
+        right_layout.addWidget(self.match_screen_checkbox)
+        
         # Progress
         progress_group = QGroupBox("Progress")
         progress_layout = QVBoxLayout()
@@ -441,6 +519,14 @@ class MainWindow(QMainWindow):
         main_layout.setStretch(0, 1)  # Map panel: takes remaining space
         main_layout.setStretch(1, 0)  # Right panel: fixed width, no stretch
         
+    @staticmethod
+    def _labeled_row(label, widget):
+        """Return a QHBoxLayout with a QLabel followed by widget."""
+        row = QHBoxLayout()
+        row.addWidget(QLabel(label))
+        row.addWidget(widget)
+        return row
+    
     def load_service_info(self):
         """Load service information from REST endpoint in background thread."""
         # Start with default extent and initialize map immediately
@@ -451,17 +537,141 @@ class MainWindow(QMainWindow):
         else:
             self.log_message("WARNING: Map widget is None after initial creation attempt")
         
+        # Use the service info prefetched at startup if there is one (instant data source switch)
+        url = f"{self.base_url}?f=json"
+        prefetched = self._prefetched_service_info.get(url)
+        if prefetched is not None:
+            self.on_service_info_loaded(dict(prefetched, base_url=self.base_url))
+            return
+        
         # Try to load actual service info in background
-        self.service_loader = ServiceInfoLoader(self.base_url)
-        self.service_loader.loaded.connect(self.on_service_info_loaded)
-        self.service_loader.error.connect(self.on_service_info_error)
-        self.service_loader.start()
+        reply = self._qnam.get(self._service_info_request(url))
+        reply.finished.connect(lambda base_url=self.base_url: self._on_service_info_reply(reply, url, base_url))
+        self._service_reply = reply
+    
+    def _service_info_request(self, url):
+        """Build the service info request, conditional on the cached ETag/Last-Modified if there are any."""
+        request = QNetworkRequest(QUrl(url))
+        # Conditional GET: an unchanged service answers 304 and the cached result is reused
+        cached = self._service_cache().get(url)
+        if cached:
+            if cached.get("etag"):
+                request.setRawHeader(b"If-None-Match", cached["etag"].encode())
+            if cached.get("last_modified"):
+                request.setRawHeader(b"If-Modified-Since", cached["last_modified"].encode())
+        return request
+    
+    def prefetch_service_info(self):
+        """Fetch the service info of the other data sources in the background so switching to them is instant."""
+        current_url = f"{self.base_url}?f=json"
+        for url in {f"{ds.url}?f=json" for ds in self.data_sources.values()} - {current_url}:
+            reply = self._qnam.get(self._service_info_request(url))
+            reply.finished.connect(lambda reply=reply, url=url: self._on_prefetch_reply(reply, url))
+    
+    def _on_prefetch_reply(self, reply, url):
+        """Store a prefetched service info result; failures are ignored (the switch then loads it normally)."""
+        reply.deleteLater()
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            return
+        try:
+            self._prefetched_service_info[url] = self._read_service_info_reply(reply, url)
+        except Exception:
+            pass
+    
+    def _service_cache(self):
+        """Return the service info cache ({url: {etag, last_modified, result}}), reading it from disk on first use."""
+        if self._svc_cache is None:
+            self._svc_cache = {}
+            try:
+                # Open directly rather than exists()+open(): a missing file is just an OSError
+                with open(self._svc_cache_path, 'r') as f:
+                    self._svc_cache = json.load(f)
+            except (OSError, ValueError):
+                pass
+        return self._svc_cache
+    
+    def _save_service_cache(self):
+        """Write the service info cache atomically; failures are ignored (cache is optional)."""
+        try:
+            tmp_path = f"{self._svc_cache_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self._svc_cache, f)
+            os.replace(tmp_path, self._svc_cache_path)
+        except OSError:
+            pass
+    
+    def _on_service_info_reply(self, reply, url, base_url):
+        """Handle a finished service info request."""
+        reply.deleteLater()
+        if reply is self._service_reply:
+            self._service_reply = None
+        if base_url != self.base_url:
+            return  # Response for a data source the user has already switched away from
+        error = reply.error()
+        if error == QNetworkReply.NetworkError.OperationCanceledError:
+            # setTransferTimeout aborts the request with OperationCanceledError
+            self.on_service_info_error("Connection timeout. Using default extent.")
+            return
+        if error != QNetworkReply.NetworkError.NoError:
+            self.on_service_info_error(f"Network error connecting to REST endpoint: {reply.errorString()}. Using default extent.")
+            return
+        try:
+            result = self._read_service_info_reply(reply, url)
+        except Exception as e:
+            self.on_service_info_error(f"Error loading service info: {str(e)}. Using default extent.")
+            return
+        self._prefetched_service_info[url] = result
+        self.on_service_info_loaded(dict(result, base_url=base_url))
+    
+    def _read_service_info_reply(self, reply, url):
+        """Return the parsed service info of a successful reply (the cached result on 304) and update the cache."""
+        cached = self._service_cache().get(url)
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if status == 304 and cached:
+            return dict(cached["result"])
+        result = _parse_service_info(json.loads(bytes(reply.readAll())))
+        # Remember the result only if the server gave us a validator for the next conditional GET
+        etag = bytes(reply.rawHeader(b"ETag")).decode() or None
+        last_modified = bytes(reply.rawHeader(b"Last-Modified")).decode() or None
+        if etag or last_modified:
+            self._svc_cache[url] = {"etag": etag, "last_modified": last_modified, "result": result}
+            self._save_service_cache()
+        return result
+        
+    def _prewarm_download_connection(self):
+        """Open a keep-alive connection to the service on the download session so the first tile skips the TLS handshake.
+        Also imports download_module (and rasterio) off the GUI thread ahead of the first download."""
+        url = self.base_url
+        if url == self._prewarmed_url:
+            return
+        self._prewarmed_url = url
         
+        def head():
+            from download_module import prewarm_connection
+            prewarm_connection(url)
+        
+        threading.Thread(target=head, daemon=True).start()
+    
     def on_service_info_loaded(self, service_data):
         """Handle successful service info load."""
+        if service_data.get("base_url", self.base_url) != self.base_url:
+            return  # Response for a data source the user has already switched away from
         extent_dict = service_data.get("extent", {})
-        ds = self.data_sources.get(self.current_data_source, {})
-        if ds.get("service_crs") == "EPSG:4326":
+        # Identical service info for the already-loaded source (e.g. a repeated refresh) needs no map work
+        digest = hash((
+            self.base_url,
+            tuple(extent_dict.get(k) for k in ("xmin", "ymin", "xmax", "ymax")),
+            service_data.get("pixel_size_x"),
+            service_data.get("pixel_size_y"),
+            tuple(service_data.get("raster_functions", ())),
+        ))
+        if (digest == self._last_service_digest and not self._data_source_changing
+                and not self._pending_selection and self.map_widget and self.map_widget.map_loaded):
+            self.log_message("Service info unchanged", level='debug')
+            return
+        self._last_service_digest = digest
+        ds = self.data_sources[self.current_data_source]
+        if ds.service_crs == "EPSG:4326":
             # Keep extent in GCS (4326), full range to poles
             self.service_extent = (
                 extent_dict["xmin"],
@@ -477,6 +687,7 @@ class MainWindow(QMainWindow):
                 extent_dict["ymax"]
             )
         self.log_message("Service info loaded successfully")
+        self._prewarm_download_connection()
         self.log_message(f"REST endpoint extent (bathymetry data bounds): {self.service_extent}")
         
         # Don't set default bounds here - wait until map loads so extent is correct
@@ -487,7 +698,7 @@ class MainWindow(QMainWindow):
         pixel_size_y = service_data.get("pixel_size_y")
         self.pixel_size_x = pixel_size_x
         self.pixel_size_y = pixel_size_y
-        if ds.get("native_resolution_only"):
+        if ds.native_resolution_only:
             self._set_native_cell_size_only()
         elif pixel_size_x is not None and pixel_size_y is not None:
             base_cell_size = max(abs(pixel_size_x), abs(pixel_size_y))
@@ -500,7 +711,7 @@ class MainWindow(QMainWindow):
         
         # Ensure map widget is initialized (this will remove loading label)
         if self.map_widget is None:
-            self.log_message("Initializing map widget...")
+            self.log_message("Initializing map widget...", level='debug')
             self.init_map_widget()
         
         # Update map extent (but don't reload if map widget already exists and is loading)
@@ -515,24 +726,24 @@ class MainWindow(QMainWindow):
             self.map_widget.base_url = self.base_url
             
             # Update raster functions and display URL from current data source
-            new_raster_function = self.data_sources[self.current_data_source]["bathymetry_raster_function"]
-            new_hillshade_raster_function = self.data_sources[self.current_data_source]["hillshade_raster_function"]
+            new_raster_function = self.data_sources[self.current_data_source].bathymetry_raster_function
+            new_hillshade_raster_function = self.data_sources[self.current_data_source].hillshade_raster_function
             self.map_widget.raster_function = new_raster_function
             self.map_widget.hillshade_raster_function = new_hillshade_raster_function
-            self.map_widget.display_url = self.data_sources[self.current_data_source].get("display_url")
-            self.map_widget.land_display_url = self.data_sources[self.current_data_source].get("land_display_url")
+            self.map_widget.display_url = self.data_sources[self.current_data_source].display_url
+            self.map_widget.land_display_url = self.data_sources[self.current_data_source].land_display_url
             
             # Check if there's a pending selection to preserve
-            if hasattr(self, '_pending_selection') and self._pending_selection:
+            if self._pending_selection:
                 # Use the pending selection extent instead of full service extent
                 selection_extent = self._pending_selection
-                self.log_message(f"Preserving selection, will zoom to it: {selection_extent}")
+                self.log_message(lambda: f"Preserving selection, will zoom to it: {selection_extent}", level='debug')
                 self.map_widget.extent = selection_extent
                 self.map_widget._requested_extent = selection_extent
             else:
                 # Always set extent to REST endpoint service extent as a baseline
                 # This ensures the map shows exactly the bathymetry data bounds from the REST endpoint
-                self.log_message(f"Updating map extent to REST endpoint extent: {self.service_extent}")
+                self.log_message(lambda: f"Updating map extent to REST endpoint extent: {self.service_extent}", level='debug')
                 self.map_widget.extent = self.service_extent
                 # Also update _requested_extent to ensure coordinate conversion is correct
                 # This ensures the map displays exactly the REST endpoint bounds, not a rounded or adjusted version
@@ -544,69 +755,54 @@ class MainWindow(QMainWindow):
             # CRITICAL: Always update selected_bbox_world to REST endpoint extent if it matches default extent
             # This ensures the box shows the exact REST endpoint bounds, not the default extent
             # Check if selected_bbox_world is None OR if it matches the default extent (needs update)
-            default_extent = self.data_sources[self.current_data_source]["default_extent"]
+            default_extent = self.data_sources[self.current_data_source].default_extent
             needs_update = (
                 self.map_widget.selected_bbox_world is None or
                 self.map_widget.selected_bbox_world == default_extent
             )
-            if needs_update and not (hasattr(self, '_pending_selection') and self._pending_selection):
-                self.log_message(f"Updating selected_bbox_world from {self.map_widget.selected_bbox_world} to REST endpoint extent {self.service_extent}")
+            if needs_update and not self._pending_selection:
+                self.log_message(lambda: f"Updating selected_bbox_world from {self.map_widget.selected_bbox_world} to REST endpoint extent {self.service_extent}", level='debug')
                 self.map_widget.selected_bbox_world = self.service_extent
                 self.map_widget.set_selection_validity(True)
                 self.selected_bbox = self.service_extent
                 # Update coordinate display to show REST endpoint bounds
                 self.update_coordinate_display(*self.service_extent, update_map=False)
             
-            # CRITICAL: Always reload map with REST endpoint extent to ensure it shows exact bathymetry data bounds
-            # Check if the map was loaded with a different extent (e.g., default extent)
-            current_extent = self.map_widget.extent
-            default_extent = self.data_sources[self.current_data_source]["default_extent"]
-            
-            # Check if map was loaded with default extent (tolerance in degrees for GCS)
-            _tol = 1e-5
-            extent_matches_default = (
-                abs(current_extent[0] - default_extent[0]) < _tol and
-                abs(current_extent[1] - default_extent[1]) < _tol and
-                abs(current_extent[2] - default_extent[2]) < _tol and
-                abs(current_extent[3] - default_extent[3]) < _tol
-            )
-            
             # Ensure default bounds are set
             if self.map_widget.selected_bbox_world is None:
                 self.map_widget.selected_bbox_world = self.service_extent
                 self.map_widget.set_selection_validity(True)
                 self.selected_bbox = self.service_extent
                 self.map_widget.service_extent = self.service_extent
-                self.log_message(f"Set default bounds to REST endpoint extent: {self.service_extent}")
+                self.log_message(lambda: f"Set default bounds to REST endpoint extent: {self.service_extent}", level='debug')
             
             # Check if there's a pending selection to restore
-            if hasattr(self, '_pending_selection') and self._pending_selection:
+            if self._pending_selection:
                 # Restore the selection - this will zoom to it and reload the map
-                self.log_message(f"Restoring pending selection: {self._pending_selection}")
-                QTimer.singleShot(300, lambda: self._restore_selection())
-            # Force reload if URL changed (data source switch) or if extent differs
-            elif url_changed or current_extent != self.service_extent or extent_matches_default:
-                if url_changed:
-                    self.log_message(f"Data source URL changed, reloading map with new service...")
-                else:
-                    self.log_message(f"Map extent ({current_extent}) differs from REST endpoint extent ({self.service_extent}), zooming to REST endpoint bounds...")
-                if not getattr(self.map_widget, '_loading', False):
-                    # CRITICAL: Use zoom_to_selection directly (like when user hits return)
-                    # This recalculates the extent with padding and positions the box correctly
-                    # Don't reload first - zoom_to_selection will reload with the correct extent
-                    # Wait a bit longer to ensure widget is fully sized
-                    QTimer.singleShot(300, lambda: self.zoom_to_selection(*self.service_extent))
-            elif not self.map_widget.map_loaded and not getattr(self.map_widget, '_loading', False):
-                self.log_message("Map not loaded yet, will load and zoom to REST endpoint extent...")
-                # Map hasn't loaded yet - use zoom_to_selection which will load the map with correct extent
-                # zoom_to_selection will:
-                # 1. Calculate extent with padding
-                # 2. Set map widget extent
-                # 3. Call load_map() to reload basemap and raster layers
+                self.log_message(lambda: f"Restoring pending selection: {self._pending_selection}", level='debug')
+                QTimer.singleShot(300, self._restore_selection)
+                return
+            
+            # CRITICAL: Always reload map with REST endpoint extent to ensure it shows exact bathymetry data bounds
+            # Reload if the URL changed (data source switch), the map isn't loaded yet, or it shows a
+            # different extent - including the default extent (tolerance in degrees for GCS)
+            current_extent = self.map_widget.extent
+            default_extent = self.data_sources[self.current_data_source].default_extent
+            _tol = 1e-5
+            needs_zoom = (
+                url_changed or
+                not self.map_widget.map_loaded or
+                current_extent != self.service_extent or
+                all(abs(c - d) < _tol for c, d in zip(current_extent, default_extent))
+            )
+            if not needs_zoom:
+                self.log_message("Map already loaded with REST endpoint extent", level='debug')
+            elif not self.map_widget._loading:
+                self.log_message("Reloading map at REST endpoint extent...", level='debug')
+                # CRITICAL: Use zoom_to_selection (like when user hits return) - it recalculates the extent
+                # with padding, positions the box correctly and does the single load_map()
                 # Wait a bit longer to ensure widget is fully sized
-                QTimer.singleShot(300, lambda: self.zoom_to_selection(*self.service_extent))
-            else:
-                self.log_message("Map already loaded with REST endpoint extent")
+                self._service_zoom_timer.start()  # Restarting drops a stale zoom from an earlier switch
         else:
             self.log_message("ERROR: Map widget is None after initialization attempt")
             
@@ -615,21 +811,44 @@ class MainWindow(QMainWindow):
         # Log the error
         self.log_message(error_message)
         
+        # A data source switch still has to show the new layers (and restore the selection) with the default extent
+        if self._data_source_changing and self.map_widget:
+            self._data_source_changing = False
+            ds = self.data_sources[self.current_data_source]
+            self.map_widget.display_url = ds.display_url
+            self.map_widget.land_display_url = ds.land_display_url
+            self._reload_map_with_selection()
+        
         # Show error message with suggestion to check for updates
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Warning)
-        msg.setWindowTitle("Connection Error")
-        msg.setText(
+        self._show_connection_error(error_message)
+        
+        # Continue with default extent - map should already be initialized
+    
+    def _show_connection_error(self, error_message):
+        """Show the connection error dialog. The dialog is built once and only its text is updated afterwards."""
+        if self._svc_err_msgbox is None:
+            self._svc_err_msgbox = QMessageBox(self)
+            self._svc_err_msgbox.setIcon(QMessageBox.Icon.Warning)
+            self._svc_err_msgbox.setWindowTitle("Connection Error")
+            self._svc_err_msgbox.setStandardButtons(QMessageBox.StandardButton.Ok)
+        self._svc_err_msgbox.setText(
             f"Unable to connect to the REST endpoint.\n\n"
             f"{error_message}\n\n"
             f"If this problem persists, please:\n"
             f"1. Check for a new version at: https://github.com/seamapper/GEBCO_Downloader\n"
             f"2. Contact: pjohnson@ccom.unh.edu"
         )
-        msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-        msg.exec()
-        
-        # Continue with default extent - map should already be initialized
+        self._svc_err_msgbox.exec()
+    
+    def _warn(self, title, text, icon=QMessageBox.Icon.Warning):
+        """Show a modal message using a single reused QMessageBox instance."""
+        if self._warn_msgbox is None:
+            self._warn_msgbox = QMessageBox(self)
+            self._warn_msgbox.setStandardButtons(QMessageBox.StandardButton.Ok)
+        self._warn_msgbox.setIcon(icon)
+        self._warn_msgbox.setWindowTitle(title)
+        self._warn_msgbox.setText(text)
+        self._warn_msgbox.exec()
             
     def init_map_widget(self):
         """Initialize the map widget."""
@@ -638,7 +857,7 @@ class MainWindow(QMainWindow):
             return
             
         # Get map group and layout - use stored reference
-        if not hasattr(self, 'map_group') or not self.map_group:
+        if self.map_group is None:
             self.log_message("ERROR: map_group not found")
             return
             
@@ -647,54 +866,22 @@ class MainWindow(QMainWindow):
             self.log_message("ERROR: Map QGroupBox has no layout")
             return
             
-        # Remove loading label if it exists - try multiple approaches
-        label_removed = False
-        
-        # First, try to remove via the stored reference
-        if hasattr(self, 'loading_label') and self.loading_label:
-            try:
-                layout.removeWidget(self.loading_label)
-                self.loading_label.hide()
-                self.loading_label.setParent(None)
-                self.loading_label.deleteLater()
-                self.loading_label = None
-                label_removed = True
-            except:
-                pass
-        
-        # Also search for any QLabel with "Loading" text in the layout
-        if not label_removed:
-            for i in reversed(range(layout.count())):
-                item = layout.itemAt(i)
-                if item and item.widget():
-                    widget = item.widget()
-                    if isinstance(widget, QLabel) and "Loading" in widget.text():
-                        try:
-                            layout.removeWidget(widget)
-                            widget.hide()
-                            widget.setParent(None)
-                            widget.deleteLater()
-                            label_removed = True
-                            break
-                        except:
-                            pass
-                    
         # Create map widget if it doesn't exist
         if self.map_widget is None:
             try:
                 # Get raster functions from current data source
-                raster_function = self.data_sources[self.current_data_source]["bathymetry_raster_function"]
-                hillshade_raster_function = self.data_sources[self.current_data_source]["hillshade_raster_function"]
+                raster_function = self.data_sources[self.current_data_source].bathymetry_raster_function
+                hillshade_raster_function = self.data_sources[self.current_data_source].hillshade_raster_function
                 show_basemap = False
                 show_hillshade = False
                 use_blend = False
-                self.log_message(f"Creating MapWidget with extent: {self.service_extent}, raster function: {raster_function}")
-                display_url = self.data_sources[self.current_data_source].get("display_url")
-                land_display_url = self.data_sources[self.current_data_source].get("land_display_url")
+                self.log_message(lambda: f"Creating MapWidget with extent: {self.service_extent}, raster function: {raster_function}", level='debug')
+                display_url = self.data_sources[self.current_data_source].display_url
+                land_display_url = self.data_sources[self.current_data_source].land_display_url
                 self.map_widget = MapWidget(self.base_url, self.service_extent, raster_function=raster_function, show_basemap=show_basemap, show_hillshade=show_hillshade, use_blend=use_blend, hillshade_raster_function=hillshade_raster_function, display_url=display_url, land_display_url=land_display_url)
                 self.map_widget.bathymetry_opacity = 1.0  # Full opacity
                 # Sync legend visibility with checkbox state
-                if hasattr(self, 'legend_checkbox'):
+                if self.legend_checkbox is not None:
                     self.map_widget.show_legend = self.legend_checkbox.isChecked()
                     self.map_widget.show_aoi = self.aoi_checkbox.isChecked()
                 # Store service extent in map widget
@@ -705,40 +892,25 @@ class MainWindow(QMainWindow):
                 self.map_widget.selectionChanged.connect(self.on_selection_changed)
                 self.map_widget.selectionCompleted.connect(self.on_selection_completed)
                 self.map_widget.mapFirstLoaded.connect(self.on_map_first_loaded)
+                self.map_widget.extentChanged.connect(self.on_map_extent_changed)
                 self.map_widget.statusMessage.connect(self.log_message)  # Connect status messages to log
                 layout.addWidget(self.map_widget)
                 self.map_widget.show()
+                self.map_group.setTitle("Map")
                 # Force UI update
                 self.map_group.update()
                 layout.update()
-                self.log_message("MapWidget created and added to layout successfully")
+                self.log_message("MapWidget created and added to layout successfully", level='debug')
                 
                 # Don't set default bounds here - wait until map loads so extent is correct
                 # Default bounds will be set in on_map_first_loaded after map loads
-                
-                # Trigger map load after a short delay to ensure widget is sized
-                self.log_message("Scheduling map load in 200ms...")
-                QTimer.singleShot(200, lambda: self.trigger_map_load())
+                # The first load is started by on_service_info_loaded once the (asynchronous) service
+                # info reply arrives, so no delayed trigger is needed here
             except Exception as e:
                 self.log_message(f"ERROR creating MapWidget: {e}")
-                import traceback
                 self.log_message(traceback.format_exc())
                 self.map_widget = None
                 
-    def trigger_map_load(self):
-        """Trigger map load - called via timer."""
-        # Don't load here - let on_service_info_loaded handle it
-        # This ensures REST endpoint extent is available and widget is properly sized
-        if self.map_widget:
-            if self.service_extent:
-                self.log_message(f"Widget ready, waiting for service info to trigger map load...")
-                self.log_message(f"Widget size: {self.map_widget.width()}x{self.map_widget.height()}")
-                self.log_message(f"REST endpoint extent: {self.service_extent}")
-            else:
-                self.log_message("REST endpoint extent not available yet, waiting for service info to load...")
-        else:
-            self.log_message("ERROR: map_widget is None when trying to trigger load")
-            
     def fit_to_extent(self):
         """Fit map to full service extent - same as initial load with padding."""
         if self.map_widget and self.service_extent:
@@ -758,10 +930,8 @@ class MainWindow(QMainWindow):
         if self.map_widget:
             self.map_widget.clear_selection()
         # Remove bold formatting from download button when selection is cleared
-        if hasattr(self, 'download_btn'):
-            font = self.download_btn.font()
-            font.setBold(False)
-            self.download_btn.setFont(font)
+        if self.download_btn is not None:
+            self._set_download_btn_bold(False)
     
     def refresh_map(self):
         """Refresh the map display for the currently shown area."""
@@ -775,21 +945,21 @@ class MainWindow(QMainWindow):
         """Export the current map display as a PNG image."""
         if not self.map_widget:
             self.log_message("Warning: Map widget not available for export")
-            QMessageBox.warning(self, "Export Error", "Map widget not available.")
+            self._warn("Export Error", "Map widget not available.")
             return
         
         if not self.map_widget.map_loaded:
             self.log_message("Warning: Map not loaded yet")
-            QMessageBox.warning(self, "Export Error", "Map is not loaded yet. Please wait for the map to load.")
+            self._warn("Export Error", "Map is not loaded yet. Please wait for the map to load.")
             return
         
         # Generate default filename with timestamp
-        from datetime import datetime
         date_time_str = datetime.now().strftime("%Y%m%d_%H%M%S")
         default_filename = f"GEBCO_Map_{date_time_str}.png"
         
         # Determine save location
-        if self.output_directory and os.path.isdir(self.output_directory):
+        self._recheck_output_directory()
+        if self._output_directory_valid:
             default_path = os.path.join(self.output_directory, default_filename)
         else:
             default_path = default_filename
@@ -806,14 +976,23 @@ class MainWindow(QMainWindow):
             return  # User cancelled
         
         try:
-            # Grab the map widget as a pixmap
-            pixmap = self.map_widget.grab()
-            
-            if pixmap.isNull():
+            # Render the map widget straight into an offscreen RGB32 image (no QPixmap round-trip),
+            # at device pixel resolution so HiDPI exports keep the detail grab() gave them
+            dpr = self.map_widget.devicePixelRatioF()
+            image = QImage(round(self.map_widget.width() * dpr), round(self.map_widget.height() * dpr),
+                           QImage.Format.Format_RGB32)
+            if image.isNull():
                 raise Exception("Failed to capture map widget")
+            image.setDevicePixelRatio(dpr)
+            image.fill(Qt.GlobalColor.white)
+            painter = QPainter(image)
+            try:
+                self.map_widget.render(painter)
+            finally:
+                painter.end()
             
             # Save to file
-            if not pixmap.save(file_path, "PNG"):
+            if not image.save(file_path, "PNG"):
                 raise Exception("Failed to save PNG file")
             
             self.log_message(f"✓ Map image exported: {file_path}")
@@ -822,7 +1001,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             error_msg = f"Error exporting map image: {str(e)}"
             self.log_message(f"✗ {error_msg}")
-            QMessageBox.critical(self, "Export Error", error_msg)
+            self._warn("Export Error", error_msg, icon=QMessageBox.Icon.Critical)
             
     # Raster function is fixed to "DAR - StdDev - BlueGreen" - no handler needed
             
@@ -855,7 +1034,7 @@ class MainWindow(QMainWindow):
         """Check if selection is valid and within size limits, update download button state."""
         # Check if there's a valid selection
         bbox = None
-        if hasattr(self, 'selected_bbox') and self.selected_bbox:
+        if self.selected_bbox:
             bbox = self.selected_bbox
         elif self.map_widget:
             bbox = self.map_widget.get_selection_bbox()
@@ -864,9 +1043,7 @@ class MainWindow(QMainWindow):
             # No selection - disable button and clear selection validity
             self.download_btn.setEnabled(False)
             # Remove bold formatting when no selection
-            font = self.download_btn.font()
-            font.setBold(False)
-            self.download_btn.setFont(font)
+            self._set_download_btn_bold(False)
             if self.map_widget:
                 self.map_widget.set_selection_validity(True)  # Default to valid (no selection shown)
             return
@@ -874,21 +1051,7 @@ class MainWindow(QMainWindow):
         # Check if selection exceeds maximum size (bbox is in GCS: west, south, east, north)
         try:
             west, south, east, north = bbox
-            ds = self.data_sources.get(self.current_data_source, {})
-            if ds.get("native_resolution_only"):
-                deg_per_pixel = ds.get("native_pixel_size_degrees", 0.004166666666666667)
-                pixels_width = int((east - west) / deg_per_pixel)
-                pixels_height = int((north - south) / abs(deg_per_pixel))
-            else:
-                ct = self.cell_size_combo.currentText() if hasattr(self, 'cell_size_combo') else ""
-                try:
-                    cell_size = float(ct) if ct else 4.0
-                except ValueError:
-                    cell_size = 4.0
-                width_m = (east - west) * 111320 * 0.5
-                height_m = (north - south) * 110540
-                pixels_width = int(width_m / cell_size)
-                pixels_height = int(height_m / cell_size)
+            pixels_width, pixels_height, _ = self._pixel_dimensions(west, south, east, north)
             
             # No size limit - always enable download button
             # Warning dialog will be shown when downloading large datasets
@@ -900,12 +1063,12 @@ class MainWindow(QMainWindow):
             
             # Enable download button unless GEBCO 2025 with no output option selected
             self.download_btn.setEnabled(True)
-            if (self.current_data_source == "GEBCO 2025" and hasattr(self, 'check_combined') and
+            if (self.current_data_source == "GEBCO 2025" and self.check_combined is not None and
                 not (self.check_combined.isChecked() or self.check_bathymetry_only.isChecked() or self.check_land_only.isChecked() or self.check_direct_measurements_only.isChecked() or self.check_direct_unknown_measurements_only.isChecked())):
                 self.download_btn.setEnabled(False)
             # Make text bold only if this is a user manual selection (not initial dataset bounds)
             is_initial_bounds = False
-            if hasattr(self, 'service_extent') and self.service_extent:
+            if self.service_extent:
                 se = self.service_extent
                 tol = 1e-5  # degrees
                 if (abs(se[0] - west) < tol and abs(se[1] - south) < tol and
@@ -913,28 +1076,30 @@ class MainWindow(QMainWindow):
                     is_initial_bounds = True
             
             # Only make bold if it's NOT the initial dataset bounds
-            font = self.download_btn.font()
-            font.setBold(not is_initial_bounds)
-            self.download_btn.setFont(font)
+            self._set_download_btn_bold(not is_initial_bounds)
         except Exception:
             # Error calculating - disable button to be safe
             self.download_btn.setEnabled(False)
             # Remove bold formatting on error
-            font = self.download_btn.font()
-            font.setBold(False)
-            self.download_btn.setFont(font)
+            self._set_download_btn_bold(False)
             if self.map_widget:
                 self.map_widget.set_selection_validity(True)  # Default to valid on error
     
+    def _set_download_btn_bold(self, want_bold):
+        """Set download button bold state, only calling setFont when the state actually changes."""
+        if want_bold != self._btn_is_bold:
+            self.download_btn.setFont(self._btn_font_bold if want_bold else self._btn_font_normal)
+            self._btn_is_bold = want_bold
+    
     def _set_native_cell_size_only(self):
         """Set cell size dropdown to single 'Native' option (for sources with native_resolution_only)."""
-        if not hasattr(self, 'cell_size_combo'):
+        if self.cell_size_combo is None:
             return
-        if hasattr(self, 'cell_size_label'):
+        if self.cell_size_label is not None:
             self.cell_size_label.setText("Resolution:")
         self.cell_size_combo.clear()
         self.cell_size_combo.addItems(["Native"])
-        if hasattr(self, 'selected_bbox') and self.selected_bbox:
+        if self.selected_bbox:
             xmin, ymin, xmax, ymax = self.selected_bbox
             self.update_coordinate_display(xmin, ymin, xmax, ymax, update_map=False)
     
@@ -945,9 +1110,9 @@ class MainWindow(QMainWindow):
             base_cell_size: The base cell size (max of pixelSizeX and pixelSizeY)
             force_highest_resolution: If True, always select the highest resolution (smallest cell size)
         """
-        if not hasattr(self, 'cell_size_combo'):
+        if self.cell_size_combo is None:
             return
-        if hasattr(self, 'cell_size_label'):
+        if self.cell_size_label is not None:
             self.cell_size_label.setText("Cell Size (m):")
         
         # Calculate the five options: base, 2x, 3x, 4x, 5x
@@ -981,72 +1146,62 @@ class MainWindow(QMainWindow):
                 self.cell_size_combo.setCurrentIndex(0)
         
         # Update pixel count if selection exists
-        if hasattr(self, 'selected_bbox') and self.selected_bbox:
+        if self.selected_bbox:
             xmin, ymin, xmax, ymax = self.selected_bbox
             self.update_coordinate_display(xmin, ymin, xmax, ymax, update_map=False)
     
     def on_cell_size_changed(self, cell_size_text):
         """Handle cell size change - update pixel count if selection exists."""
-        if not hasattr(self, 'cell_size_combo'):
+        if self.cell_size_combo is None:
             return
-        # Update pixel count display if there's a current selection
-        if hasattr(self, 'selected_bbox') and self.selected_bbox:
-            xmin, ymin, xmax, ymax = self.selected_bbox
-            self.update_coordinate_display(xmin, ymin, xmax, ymax, update_map=False)
-        # Update download button state
+        # Update pixel count display if there's a current selection (coordinates are unchanged)
+        if self.selected_bbox:
+            self._refresh_pixel_count(self.selected_bbox)
+        # Update download button state (reuses the pixel count computed above)
         self.check_and_update_download_button()
             
     def on_geographic_changed(self):
         """Handle manual entry in Geographic fields."""
         if self._updating_coordinates:
             return
+        
+        # Fields are validated by QDoubleValidator; skip while any field is empty or partial
+        edits = (self.west_edit, self.south_edit, self.east_edit, self.north_edit)
+        if not all(edit.hasAcceptableInput() for edit in edits):
+            return
+        
+        west, south, east, north = (float(edit.text()) for edit in edits)
+        
+        # Validate that min < max
+        if west >= east or south >= north:
+            QMessageBox.warning(self, "Invalid Coordinates", "West must be less than East and South must be less than North.")
+            return
+        
+        # Snap bounds to cell size grid
+        snapped_west, snapped_south, snapped_east, snapped_north, was_adjusted = self._snap_bounds_to_cell_size(west, south, east, north)
+        
+        if was_adjusted:
+            self.log_message(
+                f"Selection bounds adjusted to align with cell size grid: "
+                f"({west:.6f}, {south:.6f}, {east:.6f}, {north:.6f}) → "
+                f"({snapped_west:.6f}, {snapped_south:.6f}, {snapped_east:.6f}, {snapped_north:.6f})"
+            )
+        
+        self.update_coordinate_display(snapped_west, snapped_south, snapped_east, snapped_north, update_map=True)
             
-        try:
-            # Get values from Geographic fields
-            west_text = self.west_edit.text().strip()
-            south_text = self.south_edit.text().strip()
-            east_text = self.east_edit.text().strip()
-            north_text = self.north_edit.text().strip()
-            
-            # Check if all fields have values
-            if not (west_text and south_text and east_text and north_text):
-                return
-            
-            west = float(west_text)
-            south = float(south_text)
-            east = float(east_text)
-            north = float(north_text)
-            
-            # Validate that min < max
-            if west >= east or south >= north:
-                QMessageBox.warning(self, "Invalid Coordinates", "West must be less than East and South must be less than North.")
-                return
-            
-            # Snap bounds to cell size grid
-            snapped_west, snapped_south, snapped_east, snapped_north, was_adjusted = self._snap_bounds_to_cell_size(west, south, east, north)
-            
-            if was_adjusted:
-                self.log_message(
-                    f"Selection bounds adjusted to align with cell size grid: "
-                    f"({west:.6f}, {south:.6f}, {east:.6f}, {north:.6f}) → "
-                    f"({snapped_west:.6f}, {snapped_south:.6f}, {snapped_east:.6f}, {snapped_north:.6f})"
-                )
-            
-            self.update_coordinate_display(snapped_west, snapped_south, snapped_east, snapped_north, update_map=True)
-        except ValueError:
-            QMessageBox.warning(self, "Invalid Input", "Please enter valid numeric coordinates.")
-            self.check_and_update_download_button()  # Disable button on invalid input
-            
-    def update_coordinate_display(self, west, south, east, north, update_map=True):
-        """Update GCS (West, South, East, North) display. All coordinates in 4326."""
+    def update_coordinate_display(self, west, south, east, north, update_map=True, skip_pixel_recount=False):
+        """Update GCS (West, South, East, North) display. All coordinates in 4326.
+        
+        If skip_pixel_recount is True, the pixel count label is left untouched (caller refreshes it).
+        """
         if self._updating_coordinates:
             return
         self._updating_coordinates = True
         try:
-            self.west_edit.setText(f"{west:.6f}")
-            self.south_edit.setText(f"{south:.6f}")
-            self.east_edit.setText(f"{east:.6f}")
-            self.north_edit.setText(f"{north:.6f}")
+            self._set_if_changed(self.west_edit, f"{west:.6f}")
+            self._set_if_changed(self.south_edit, f"{south:.6f}")
+            self._set_if_changed(self.east_edit, f"{east:.6f}")
+            self._set_if_changed(self.north_edit, f"{north:.6f}")
             if update_map:
                 self.selected_bbox = (west, south, east, north)
                 if self.map_widget:
@@ -1057,25 +1212,80 @@ class MainWindow(QMainWindow):
         # Update download button state
         self.check_and_update_download_button()
         
+        if not skip_pixel_recount:
+            self._refresh_pixel_count((west, south, east, north))
+    
+    @staticmethod
+    def _set_if_changed(edit, text):
+        """Set a line edit's text only when it differs, avoiding a needless relayout/repaint."""
+        if edit.text() != text:
+            edit.setText(text)
+    
+    def _download_pixel_size_degrees(self, ds):
+        """Return the download cell size in degrees for a native-resolution data source.
+        
+        Uses the native cell size unless "Match Screen Resolution" is checked, in which case the
+        coarsest overview level that is not coarser than the map's degrees-per-pixel is chosen.
+        """
+        native = ds.native_pixel_size_degrees
+        if not (self.match_screen_checkbox is not None and self.match_screen_checkbox.isChecked()):
+            return native
+        if not self.map_widget or self.map_widget.width() <= 0:
+            return native
+        extent = self.map_widget.extent
+        screen_dpp = (extent[2] - extent[0]) / self.map_widget.width()
+        overviews = ds.overview_pixel_sizes_degrees or [native]
+        finer = [p for p in overviews if p <= screen_dpp]
+        return max(finer) if finer else min(overviews)
+    
+    def on_match_screen_toggled(self, checked):
+        """Handle Match Screen Resolution toggle - update pixel count for the new cell size."""
+        if self.selected_bbox:
+            self._refresh_pixel_count(self.selected_bbox)
+        self.check_and_update_download_button()
+    
+    def on_map_extent_changed(self):
+        """Handle a new map extent - with Match Screen Resolution the download cell size follows the view."""
+        if self.match_screen_checkbox is not None and self.match_screen_checkbox.isChecked():
+            if self.selected_bbox:
+                self._refresh_pixel_count(self.selected_bbox)
+            self.check_and_update_download_button()
+    
+    def _pixel_dimensions(self, west, south, east, north):
+        """Return (pixels_width, pixels_height, cell_size_label) for a GCS bbox at the current resolution.
+        
+        The last result is memoized so repeated calls for the same bbox and resolution skip the math.
+        """
+        ct = self.cell_size_combo.currentText() if self.cell_size_combo is not None else ""
+        ds = self.data_sources[self.current_data_source]
+        deg_per_pixel = self._download_pixel_size_degrees(ds) if ds.native_resolution_only else None
+        key = (west, south, east, north, self.current_data_source, ct, deg_per_pixel)
+        if self._pixel_dims_cache is not None and self._pixel_dims_cache[0] == key:
+            return self._pixel_dims_cache[1]
+        if deg_per_pixel is not None:
+            pixels_width = int((east - west) / deg_per_pixel)
+            pixels_height = int((north - south) / abs(deg_per_pixel))
+            # Filename-safe: overview levels are whole arc-seconds (30arcsec, 60arcsec, ...)
+            cell_size_label = "native" if deg_per_pixel == ds.native_pixel_size_degrees else f"{deg_per_pixel * 3600:g}arcsec"
+        else:
+            width_meters = (east - west) * 111320 * 0.5  # approx at mid-lat
+            height_meters = (north - south) * 110540
+            try:
+                cell_size = float(ct) if ct else 4.0
+            except ValueError:
+                cell_size = 4.0
+            pixels_width = int(width_meters / cell_size)
+            pixels_height = int(height_meters / cell_size)
+            cell_size_label = f"{cell_size}m"
+        result = (pixels_width, pixels_height, cell_size_label)
+        self._pixel_dims_cache = (key, result)
+        return result
+    
+    def _refresh_pixel_count(self, bbox):
+        """Update the pixel count label for a GCS bbox (west, south, east, north)."""
         # Calculate expected number of pixels (bbox is in GCS: west, south, east, north)
         try:
-            ds = self.data_sources.get(self.current_data_source, {})
-            if ds.get("native_resolution_only"):
-                deg_per_pixel = ds.get("native_pixel_size_degrees", 0.004166666666666667)
-                pixels_width = int((east - west) / deg_per_pixel)
-                pixels_height = int((north - south) / abs(deg_per_pixel))
-                cell_size_label = "native"
-            else:
-                width_meters = (east - west) * 111320 * 0.5  # approx at mid-lat
-                height_meters = (north - south) * 110540
-                ct = self.cell_size_combo.currentText() if hasattr(self, 'cell_size_combo') else ""
-                try:
-                    cell_size = float(ct) if ct else 4.0
-                except ValueError:
-                    cell_size = 4.0
-                pixels_width = int(width_meters / cell_size)
-                pixels_height = int(height_meters / cell_size)
-                cell_size_label = f"{cell_size}m"
+            pixels_width, pixels_height, _ = self._pixel_dimensions(*bbox)
             
             total_pixels = pixels_width * pixels_height
             pixels_width_str = f"{pixels_width:,}"
@@ -1085,19 +1295,27 @@ class MainWindow(QMainWindow):
             is_large = pixels_width > large_size_threshold or pixels_height > large_size_threshold
             
             if is_large:
-                self.pixel_count_label.setText(
+                self._set_pixel_count_text(
                     f"⚠️ Output Grid Pixels : {pixels_width_str} × {pixels_height_str} = {total_pixels_str} "
-                    f"(LARGE DATASET!)"
+                    f"(LARGE DATASET!)",
+                    large=True
                 )
-                self.pixel_count_label.setStyleSheet("font-weight: bold; padding: 5px; color: orange;")
             else:
-                self.pixel_count_label.setText(
+                self._set_pixel_count_text(
                     f"Output Grid Pixels : {pixels_width_str} × {pixels_height_str} = {total_pixels_str}"
                 )
-                self.pixel_count_label.setStyleSheet("font-weight: bold; padding: 5px;")
         except Exception:
-            self.pixel_count_label.setText("Pixels: --")
-            self.pixel_count_label.setStyleSheet("font-weight: bold; padding: 5px;")
+            self._set_pixel_count_text("Pixels: --")
+    
+    def _set_pixel_count_text(self, text, large=False):
+        """Set the pixel count label, skipping setText/setStyleSheet (style reparse) when nothing changed."""
+        if text != self._pixel_count_text:
+            self.pixel_count_label.setText(text)
+            self._pixel_count_text = text
+        if large != self._pixel_count_large:
+            color = " color: orange;" if large else ""
+            self.pixel_count_label.setStyleSheet(f"font-weight: bold; padding: 5px;{color}")
+            self._pixel_count_large = large
             
     def on_selection_changed(self, xmin, ymin, xmax, ymax):
         """Handle selection change from map (during dragging)."""
@@ -1107,7 +1325,7 @@ class MainWindow(QMainWindow):
             self.south_edit.clear()
             self.east_edit.clear()
             self.north_edit.clear()
-            self.pixel_count_label.setText("Pixels: --")
+            self._set_pixel_count_text("Pixels: --")
             self.selected_bbox = None
             self.download_btn.setEnabled(False)
         else:
@@ -1121,16 +1339,15 @@ class MainWindow(QMainWindow):
         Returns:
             tuple: (snapped_west, snapped_south, snapped_east, snapped_north, was_adjusted)
         """
-        import math
-        ds = self.data_sources.get(self.current_data_source, {})
+        ds = self.data_sources[self.current_data_source]
         
         # Determine pixel size in degrees
-        if ds.get("native_resolution_only"):
+        if ds.native_resolution_only:
             # Use native pixel size
-            pixel_size_degrees = ds.get("native_pixel_size_degrees", 0.004166666666666667)
+            pixel_size_degrees = ds.native_pixel_size_degrees
         else:
             # Convert cell size from meters to degrees (approximate)
-            ct = self.cell_size_combo.currentText() if hasattr(self, 'cell_size_combo') else ""
+            ct = self.cell_size_combo.currentText() if self.cell_size_combo is not None else ""
             if ct:
                 try:
                     cell_size_m = float(ct)
@@ -1174,11 +1391,10 @@ class MainWindow(QMainWindow):
             
             # Store the selected bbox for download
             self.selected_bbox = (snapped_west, snapped_south, snapped_east, snapped_north)
-            # Temporarily disconnect the selection changed signal to prevent clearing
-            self.map_widget.selectionChanged.disconnect()
-            self.zoom_to_selection(snapped_west, snapped_south, snapped_east, snapped_north)
-            # Reconnect the signal
-            self.map_widget.selectionChanged.connect(self.on_selection_changed)
+            # Block map widget signals while zooming to prevent clearing the selection
+            # (QSignalBlocker restores the previous state even if zoom_to_selection raises)
+            with QSignalBlocker(self.map_widget):
+                self.zoom_to_selection(snapped_west, snapped_south, snapped_east, snapped_north)
             # Set the final bounds in the text fields after zoom (both coordinate systems)
             self.update_coordinate_display(snapped_west, snapped_south, snapped_east, snapped_north)
             # Button state will be updated by update_coordinate_display (which calls check_and_update_download_button)
@@ -1196,50 +1412,27 @@ class MainWindow(QMainWindow):
                 QTimer.singleShot(200, lambda: self.zoom_to_selection(xmin, ymin, xmax, ymax))
                 return
             
-            # Calculate the selected area dimensions
-            selection_width = xmax - xmin
-            selection_height = ymax - ymin
-            
-            # Add 5% padding around the selection
-            padding_x = selection_width * 0.05
-            padding_y = selection_height * 0.05
-            
-            # Start with padded extent
-            padded_xmin = xmin - padding_x
-            padded_ymin = ymin - padding_y
-            padded_xmax = xmax + padding_x
-            padded_ymax = ymax + padding_y
-            
-            padded_width = padded_xmax - padded_xmin
-            padded_height = padded_ymax - padded_ymin
-            
-            if widget_width > 0 and widget_height > 0:
-                widget_aspect = widget_width / widget_height
-                padded_aspect = padded_width / padded_height
-                
-                # Calculate center of padded area
-                center_x = (padded_xmin + padded_xmax) / 2
-                center_y = (padded_ymin + padded_ymax) / 2
-                
-                # Adjust extent to match widget aspect ratio while containing the padded selection
-                if padded_aspect > widget_aspect:
-                    # Padded area is wider than widget - use padded width, adjust height
-                    new_width = padded_width
-                    new_height = new_width / widget_aspect
-                else:
-                    # Padded area is taller than widget - use padded height, adjust width
-                    new_height = padded_height
-                    new_width = new_height * widget_aspect
-                
-                # Create new extent centered on the padded selection
-                new_extent = (
-                    center_x - new_width / 2,
-                    center_y - new_height / 2,
-                    center_x + new_width / 2,
-                    center_y + new_height / 2
-                )
-            else:
-                new_extent = (padded_xmin, padded_ymin, padded_xmax, padded_ymax)
+            # Add 5% padding on each side of the selection (padded size = 1.1x selection size)
+            padded_width = (xmax - xmin) * 1.1
+            padded_height = (ymax - ymin) * 1.1
+            
+            # Padding is symmetric, so the padded area shares the selection's center
+            center_x = (xmin + xmax) * 0.5
+            center_y = (ymin + ymax) * 0.5
+            
+            # Scale the widget's shape up until it contains the padded selection on both axes:
+            # the limiting axis keeps its padded size, the other one grows to the widget aspect ratio
+            scale = max(padded_width / widget_width, padded_height / widget_height)
+            half_w = widget_width * scale * 0.5
+            half_h = widget_height * scale * 0.5
+            
+            # Create new extent centered on the padded selection
+            new_extent = (center_x - half_w, center_y - half_h, center_x + half_w, center_y + half_h)
+            # A sub-pixel change (e.g. coordinates re-read from the 6-decimal fields) shows the same map:
+            # keep the loaded extent so no new export image is requested
+            already_loaded = self.map_widget.has_loaded_extent(new_extent, tol=scale * 0.5)
+            if already_loaded:
+                new_extent = self.map_widget._last_loaded_extent
             # Set the extent FIRST, then store the selection bbox
             # This ensures the selection bbox is stored with the correct extent context
             self.map_widget.extent = new_extent
@@ -1248,26 +1441,34 @@ class MainWindow(QMainWindow):
             # This is what will be shown in the yellow/green box and used for download
             self.map_widget.selected_bbox_world = (xmin, ymin, xmax, ymax)
             # Ensure service_extent is preserved
-            if not hasattr(self.map_widget, 'service_extent') or self.map_widget.service_extent is None:
+            if self.map_widget.service_extent is None:
                 self.map_widget.service_extent = self.service_extent
             # Don't clear selection - keep it visible
-            self.map_widget.load_map()
+            if already_loaded:
+                # Map is already showing this extent - just repaint the selection box
+                self.map_widget.update()
+            else:
+                self.map_widget.load_map()
             
     def start_download(self):
         """Start downloading the selected area. Bbox is always in GCS (4326)."""
+        # The download button can be re-enabled by a selection change mid-download; never run two
+        # downloads at once (they would repeat the same exports and orphan the running thread)
+        if self.downloader and self.downloader.isRunning():
+            self.log_message("A download is already in progress")
+            return
+        self._recheck_output_directory()
         bbox = None
-        if hasattr(self, 'selected_bbox') and self.selected_bbox:
+        if self.selected_bbox:
             bbox = self.selected_bbox
         elif self.map_widget:
             bbox = self.map_widget.get_selection_bbox()
         else:
+            edits = (self.west_edit, self.south_edit, self.east_edit, self.north_edit)
             try:
-                west_text = self.west_edit.text().strip()
-                south_text = self.south_edit.text().strip()
-                east_text = self.east_edit.text().strip()
-                north_text = self.north_edit.text().strip()
-                if west_text and south_text and east_text and north_text:
-                    bbox = (float(west_text), float(south_text), float(east_text), float(north_text))
+                # float() ignores surrounding whitespace; empty fields leave bbox unset
+                if all(edit.text().strip() for edit in edits):
+                    bbox = tuple(float(edit.text()) for edit in edits)
             except ValueError:
                 QMessageBox.warning(self, "Invalid Input", "Please enter valid coordinates.")
                 return
@@ -1275,20 +1476,18 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Selection", "Please select an area on the map.")
             return
         output_crs = "EPSG:4326"
-        ds = self.data_sources.get(self.current_data_source, {})
-        native_only = ds.get("native_resolution_only", False)
+        ds = self.data_sources[self.current_data_source]
+        native_only = ds.native_resolution_only
         if native_only:
             # Bbox is (west, south, east, north) in 4326
             bbox_4326 = bbox
             lon_min, lat_min, lon_max, lat_max = bbox
-            pixel_size_degrees = ds.get("native_pixel_size_degrees", 0.004166666666666667)
-            pixels_width = int((lon_max - lon_min) / pixel_size_degrees)
-            pixels_height = int((lat_max - lat_min) / abs(pixel_size_degrees))
-            cell_size_for_filename = "native"
+            pixel_size_degrees = self._download_pixel_size_degrees(ds)
+            pixels_width, pixels_height, cell_size_for_filename = self._pixel_dimensions(lon_min, lat_min, lon_max, lat_max)
         else:
             xmin, ymin, xmax, ymax = bbox
             try:
-                cell_size = float(self.cell_size_combo.currentText()) if hasattr(self, 'cell_size_combo') and self.cell_size_combo.count() else 4.0
+                cell_size = float(self.cell_size_combo.currentText()) if self.cell_size_combo is not None and self.cell_size_combo.count() else 4.0
             except (ValueError, AttributeError):
                 cell_size = 4.0
             width_meters = xmax - xmin
@@ -1300,9 +1499,13 @@ class MainWindow(QMainWindow):
         large_size_threshold = 10000
         if pixels_width > large_size_threshold or pixels_height > large_size_threshold:
             total_pixels = pixels_width * pixels_height
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowTitle("Large Dataset Warning")
+            if self._large_warning_msgbox is None:
+                # Built once and retargeted with setText on later downloads
+                self._large_warning_msgbox = QMessageBox(self)
+                self._large_warning_msgbox.setIcon(QMessageBox.Icon.Warning)
+                self._large_warning_msgbox.setWindowTitle("Large Dataset Warning")
+                self._large_warning_msgbox.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.Cancel)
+            msg = self._large_warning_msgbox
             msg.setText(
                 f"You are about to download a very large dataset.\n\n"
                 f"Requested size: {pixels_width:,} × {pixels_height:,} pixels\n"
@@ -1311,19 +1514,15 @@ class MainWindow(QMainWindow):
                 f"{'Tiled download is enabled and will break this into multiple requests.' if self.tile_download_checkbox.isChecked() else 'Consider enabling Tile Download for better reliability.'}\n\n"
                 f"Do you want to continue?"
             )
-            msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.Cancel)
             msg.setDefaultButton(QMessageBox.StandardButton.Cancel)
             result = msg.exec()
             if result == QMessageBox.StandardButton.Cancel:
                 return
         
-        current_time = datetime.now()
-        date_time_str = current_time.strftime("%Y-%m-%d_%H-%M-%S")
-        
         # Build list of requested outputs for GEBCO 2025 (any combination of the three)
         output_requests = []  # list of (mode, path)
         tid_url = None
-        if native_only and self.current_data_source == "GEBCO 2025" and hasattr(self, 'check_combined'):
+        if native_only and self.current_data_source == "GEBCO 2025" and self.check_combined is not None:
             if self.check_combined.isChecked():
                 output_requests.append(("combined", None))  # path filled below
             if self.check_bathymetry_only.isChecked():
@@ -1335,83 +1534,33 @@ class MainWindow(QMainWindow):
             if self.check_direct_unknown_measurements_only.isChecked():
                 output_requests.append(("direct_unknown_measurements_only", None))
             if output_requests:
-                tid_url = self.data_sources.get("GEBCO 2025 TID", {}).get("url")
+                tid_url = self.data_sources["GEBCO 2025 TID"].url
             if self.current_data_source == "GEBCO 2025" and not output_requests:
                 QMessageBox.warning(self, "No Output Selected", "Select at least one output: Combined Bathymetry && Land, Bathymetry Only, Land Only, Direct Measurements Only, or Direct && Unknown Measurement Only.")
                 return
         
-        # Resolve output path(s) for GEBCO 2025 (multiple outputs possible)
+        # Resolve output path(s); GEBCO 2025 may request several outputs at once
+        date_time_str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        # Overview-level downloads ("Match Screen Resolution") carry their cell size in the name
+        resolution_tag = f"_{cell_size_for_filename}" if native_only and cell_size_for_filename != "native" else ""
         if native_only and "TID" not in self.current_data_source and output_requests:
-            if len(output_requests) > 1:
-                if not self.output_directory or not os.path.isdir(self.output_directory):
-                    QMessageBox.warning(self, "Output Directory Required", "Select an output directory when saving multiple grids.")
-                    return
-                out_dir = self.output_directory
-                resolved = []
-                for mode, _ in output_requests:
-                    # Use shorter names for certain modes
-                    if mode == "bathymetry_only":
-                        mode_name = "bathymetry"
-                    elif mode == "land_only":
-                        mode_name = "land"
-                    elif mode == "direct_measurements_only":
-                        mode_name = "direct"
-                    elif mode == "direct_unknown_measurements_only":
-                        mode_name = "direct_unknown"
-                    else:
-                        mode_name = mode
-                    fn = f"GEBCO_2025_{mode_name}_{date_time_str}.tif"
-                    resolved.append((mode, os.path.join(out_dir, fn)))
-                output_requests = resolved
-            else:
-                # Single output
-                mode = output_requests[0][0]
-                # Use shorter names for certain modes
-                if mode == "bathymetry_only":
-                    mode_name = "bathymetry"
-                elif mode == "land_only":
-                    mode_name = "land"
-                elif mode == "direct_measurements_only":
-                    mode_name = "direct"
-                elif mode == "direct_unknown_measurements_only":
-                    mode_name = "direct_unknown"
-                else:
-                    mode_name = mode
-                default_name = f"GEBCO_2025_{mode_name}_{date_time_str}.tif"
-                if self.output_directory and os.path.isdir(self.output_directory):
-                    output_path = os.path.join(self.output_directory, default_name)
-                else:
-                    output_path, _ = QFileDialog.getSaveFileName(self, "Save GeoTIFF", default_name, "GeoTIFF Files (*.tif *.tiff);;All Files (*)")
-                    if not output_path:
-                        return
-                output_requests = [(mode, output_path)]
-        elif native_only and "TID" in self.current_data_source:
-            default_filename = f"GEBCO_2025_TID_{date_time_str}.tif"
-            if self.output_directory and os.path.isdir(self.output_directory):
-                output_path = os.path.join(self.output_directory, default_filename)
-            else:
-                output_path, _ = QFileDialog.getSaveFileName(self, "Save GeoTIFF", default_filename, "GeoTIFF Files (*.tif *.tiff);;All Files (*)")
-                if not output_path:
-                    return
-            output_requests = [("combined", output_path)]  # TID is single "combined" style
-        elif native_only:
-            default_filename = f"GEBCO_2025_{date_time_str}.tif"
-            if self.output_directory and os.path.isdir(self.output_directory):
-                output_path = os.path.join(self.output_directory, default_filename)
-            else:
-                output_path, _ = QFileDialog.getSaveFileName(self, "Save GeoTIFF", default_filename, "GeoTIFF Files (*.tif *.tiff);;All Files (*)")
-                if not output_path:
-                    return
-            output_requests = [("combined", output_path)]
+            if len(output_requests) > 1 and not self._output_directory_valid:
+                QMessageBox.warning(self, "Output Directory Required", "Select an output directory when saving multiple grids.")
+                return
+            output_requests = [
+                (mode, self._resolve_output_path(f"GEBCO_2025_{_MODE_SHORT_NAME.get(mode, mode)}{resolution_tag}_{date_time_str}.tif"))
+                for mode, _ in output_requests
+            ]
         else:
-            default_filename = f"GEBCO_Bathy_{cell_size_for_filename}m_{date_time_str}.tif"
-            if self.output_directory and os.path.isdir(self.output_directory):
-                output_path = os.path.join(self.output_directory, default_filename)
+            if native_only and "TID" in self.current_data_source:
+                default_filename = f"GEBCO_2025_TID{resolution_tag}_{date_time_str}.tif"
+            elif native_only:
+                default_filename = f"GEBCO_2025{resolution_tag}_{date_time_str}.tif"
             else:
-                output_path, _ = QFileDialog.getSaveFileName(self, "Save GeoTIFF", default_filename, "GeoTIFF Files (*.tif *.tiff);;All Files (*)")
-                if not output_path:
-                    return
-            output_requests = [("combined", output_path)]
+                default_filename = f"GEBCO_Bathy_{cell_size_for_filename}m_{date_time_str}.tif"
+            output_requests = [("combined", self._resolve_output_path(default_filename))]  # TID is single "combined" style
+        if not all(path for _, path in output_requests):
+            return  # Save dialog was cancelled
         
         # Disable download button
         self.download_btn.setEnabled(False)
@@ -1421,6 +1570,9 @@ class MainWindow(QMainWindow):
         # Get tile download setting
         use_tile_download = self.tile_download_checkbox.isChecked()
         
+        # Imported on first download so GUI startup does not pay for loading rasterio
+        from download_module import BathymetryDownloader
+        
         max_size = 14000
         if native_only:
             self.downloader = BathymetryDownloader(
@@ -1440,22 +1592,51 @@ class MainWindow(QMainWindow):
             self.downloader = BathymetryDownloader(
                 self.base_url,
                 bbox,
-                output_path,
+                output_requests[0][1],
                 output_crs,
                 pixel_size=cell_size,
                 max_size=max_size,
                 use_tile_download=use_tile_download
             )
-        self.downloader.progress.connect(self.progress_bar.setValue)
+        self._last_progress = 0
+        self._last_status = None
+        self.downloader.progress.connect(self.on_download_progress)
         self.downloader.status.connect(self.on_status_update)
         self.downloader.finished.connect(self.on_download_finished)
         self.downloader.error.connect(self.on_download_error)
+        self._progress_timer.start()
         self.downloader.start()
         
+    def _resolve_output_path(self, default_filename):
+        """Return the save path for default_filename: in the output directory if set, otherwise ask the user ("" if cancelled)."""
+        self._recheck_output_directory()
+        if self._output_directory_valid:
+            return os.path.join(self.output_directory, default_filename)
+        output_path, _ = QFileDialog.getSaveFileName(self, "Save GeoTIFF", default_filename, "GeoTIFF Files (*.tif *.tiff);;All Files (*)")
+        return output_path
+    
+    def on_download_progress(self, value):
+        """Store downloader progress; the progress bar is updated by _progress_timer."""
+        self._last_progress = value
+    
     def on_status_update(self, message):
-        """Handle status update from downloader."""
-        self.status_label.setText(message)
+        """Handle status update from downloader. The status label is updated by _progress_timer."""
+        self._last_status = message
         self.log_message(message)
+    
+    def _flush_download_progress(self):
+        """Push the latest downloader progress and status to the widgets."""
+        if self.progress_bar.value() != self._last_progress:
+            self.progress_bar.setValue(self._last_progress)
+        if self._last_status is not None:
+            self.status_label.setText(self._last_status)
+            self._last_status = None
+    
+    def _stop_download_progress(self):
+        """Stop the progress throttle timer and show the final progress value."""
+        self._progress_timer.stop()
+        self._last_status = None  # Finish/error handlers set their own status text
+        self.progress_bar.setValue(self._last_progress)
         
     def on_download_finished(self, file_path):
         """Handle download completion. file_path may be newline-separated for multiple files."""
@@ -1463,48 +1644,56 @@ class MainWindow(QMainWindow):
         if not paths:
             paths = [file_path]
         display = "\n".join(paths)
+        self._stop_download_progress()
         self.status_label.setText(f"Download complete: {paths[0]}" if len(paths) == 1 else f"Download complete: {len(paths)} files")
         self.log_message(f"✓ Download complete: {display}")
         self.download_btn.setEnabled(True)
         # Remove bold formatting after download completes
-        font = self.download_btn.font()
-        font.setBold(False)
-        self.download_btn.setFont(font)
+        self._set_download_btn_bold(False)
+        self._flush_log()  # Show the final log lines before the modal dialog opens
         QMessageBox.information(self, "Success", f"GeoTIFF(s) saved to:\n{display}")
         
     def on_download_error(self, error_message):
         """Handle download error."""
+        self._stop_download_progress()
         self.status_label.setText(f"Error: {error_message}")
         self.log_message(f"✗ Error: {error_message}")
         self.download_btn.setEnabled(True)
         # Remove bold formatting after download error
-        font = self.download_btn.font()
-        font.setBold(False)
-        self.download_btn.setFont(font)
+        self._set_download_btn_bold(False)
         
         # Check if it's a connection error and show helpful message
         if "connection" in error_message.lower() or "timeout" in error_message.lower() or "network" in error_message.lower() or "rest endpoint" in error_message.lower():
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowTitle("Connection Error")
-            msg.setText(
-                f"Unable to connect to the REST endpoint.\n\n"
-                f"{error_message}\n\n"
-                f"If this problem persists, please:\n"
-                f"1. Check for a new version at: https://github.com/seamapper/GEBCO_Downloader\n"
-                f"2. Contact: pjohnson@ccom.unh.edu"
-            )
-            msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-            msg.exec()
+            self._show_connection_error(error_message)
+        self._flush_log()  # Show the final log lines before the modal dialog opens
         QMessageBox.critical(self, "Download Error", error_message)
         
-    def log_message(self, message, bold=False, color=None):
-        """Add message to log. If bold is True, the message is shown in bold (HTML). If color is set, wrap in span (e.g. 'orange')."""
+    def log_message(self, message, bold=False, color=None, level='info'):
+        """Add message to log. If bold is True, the message is shown in bold (HTML). If color is set, wrap in span (e.g. 'orange').
+        Messages with level='debug' are dropped unless verbose_log is set in the config; message may be a callable
+        returning the text, so a dropped debug message is never formatted."""
+        if level == 'debug' and not self._verbose_log:
+            return
+        if callable(message):
+            message = message()
         if bold:
             message = f"<b>{message}</b>"
         if color:
             message = f'<span style="color: {color};">{message}</span>'
-        self.log_text.append(message)
+        self._log_buf.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """Append the buffered log messages with a single repaint."""
+        if not self._log_buf:
+            return
+        # Append each message separately so plain and rich text lines keep their own formatting
+        self.log_text.setUpdatesEnabled(False)
+        for message in self._log_buf:
+            self.log_text.append(message)
+        self._log_buf.clear()
+        self.log_text.setUpdatesEnabled(True)
         # Auto-scroll to bottom
         scrollbar = self.log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
@@ -1514,24 +1703,14 @@ class MainWindow(QMainWindow):
         super().resizeEvent(event)
         # Refresh map when window is resized (with a small delay to avoid multiple refreshes)
         if self.map_widget and self.map_widget.map_loaded:
-            # Use a timer to debounce rapid resize events
-            if not hasattr(self, '_resize_timer'):
-                self._resize_timer = QTimer()
-                self._resize_timer.setSingleShot(True)
-                self._resize_timer.timeout.connect(self._refresh_map_on_resize)
-            
             # Restart timer - will trigger refresh 300ms after resize stops
-            self._resize_timer.stop()
-            self._resize_timer.start(300)
+            self._resize_timer.start()
     
     def _refresh_map_on_resize(self):
         """Refresh map display after window resize."""
         if self.map_widget and self.map_widget.map_loaded:
-            # Ensure widget size is updated before calculating new extent
-            # Process events to ensure Qt has updated the widget size
-            QApplication.processEvents()
-            
-            # Verify widget size is valid before proceeding
+            # The 300ms debounce in resizeEvent gives Qt time to lay out the widget,
+            # so the size can be read directly (no processEvents, which could re-enter)
             widget_width = self.map_widget.width()
             widget_height = self.map_widget.height()
             
@@ -1539,6 +1718,14 @@ class MainWindow(QMainWindow):
                 # Widget not sized yet, skip this resize
                 return
             
+            # Skip the reload if the size changed by less than 2px and the extent is unchanged
+            current_extent = tuple(round(v, 6) for v in self.map_widget.extent)
+            if self._last_render_key is not None:
+                last_width, last_height, last_extent = self._last_render_key
+                if (abs(widget_width - last_width) < 2 and abs(widget_height - last_height) < 2
+                        and last_extent == current_extent):
+                    return
+            
             # If there's a selected area, zoom to it to maintain constant visual size
             # This treats the resize as if the user made a new selection with the same bounds
             # The zoom_to_selection function will recalculate the extent based on the new widget size
@@ -1551,6 +1738,8 @@ class MainWindow(QMainWindow):
             else:
                 # No selection - just reload the map with current extent
                 self.map_widget.load_map()
+            self._last_render_key = (widget_width, widget_height,
+                                     tuple(round(v, 6) for v in self.map_widget.extent))
     
     def closeEvent(self, event):
         """Handle window close event."""
@@ -1567,38 +1756,102 @@ class MainWindow(QMainWindow):
             else:
                 event.ignore()
                 return
+        self._config_save_timer.stop()
+        self.save_config()  # Remember the current selection and data source for the next launch
         event.accept()
     
     def load_config(self):
         """Load configuration from JSON file."""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    self.output_directory = config.get('output_directory')
-                    # Update edit field if it exists (it should after init_ui)
-                    if hasattr(self, 'output_dir_edit'):
-                        if self.output_directory and os.path.isdir(self.output_directory):
-                            self.output_dir_edit.setText(self.output_directory)
-                        else:
-                            self.output_directory = None
-                            self.output_dir_edit.clear()
-                    elif not (self.output_directory and os.path.isdir(self.output_directory)):
-                        self.output_directory = None
+            # Read directly - a missing config (first launch) raises and falls back to defaults below
+            data = Path(self.config_file).read_bytes()
+            config = orjson.loads(data) if orjson else json.loads(data)
+            self._set_output_directory(config.get('output_directory'))
+            self._verbose_log = bool(config.get('verbose_log', False))
+            # Update edit field if it exists (it should after init_ui)
+            if self.output_dir_edit is not None:
+                if self._output_directory_valid:
+                    self.output_dir_edit.setText(self.output_directory)
+                else:
+                    self.output_dir_edit.clear()
+            self._restore_last_session(config)
         except Exception as e:
             # If config file is corrupted or can't be read, just use defaults
-            self.output_directory = None
-            if hasattr(self, 'output_dir_edit'):
+            self._set_output_directory(None)
+            if self.output_dir_edit is not None:
                 self.output_dir_edit.clear()
     
+    def _set_output_directory(self, directory):
+        """Set the output directory, cache whether it exists and watch it for removal."""
+        watched = self._output_dir_watcher.directories()
+        if watched:
+            self._output_dir_watcher.removePaths(watched)
+        self._output_directory_valid = bool(directory and os.path.isdir(directory))
+        self.output_directory = directory if self._output_directory_valid else None
+        if self._output_directory_valid:
+            self._output_dir_watcher.addPath(directory)
+    
+    def _on_output_directory_changed(self, path):
+        """Re-check the output directory when the watcher reports a change (e.g. it was deleted)."""
+        was_valid = self._output_directory_valid
+        self._output_directory_valid = bool(self.output_directory and os.path.isdir(self.output_directory))
+        if was_valid and not self._output_directory_valid:
+            # The watcher drops a deleted path; _recheck_output_directory re-adds it if the directory comes back
+            self.log_message(f"Output directory no longer exists: {self.output_directory} - "
+                             f"downloads will ask where to save until it is recreated or another directory is selected",
+                             color='orange')
+    
+    def _recheck_output_directory(self):
+        """Re-validate an output directory that had disappeared (it may have been recreated) and watch it again."""
+        if self._output_directory_valid or not self.output_directory:
+            return
+        if os.path.isdir(self.output_directory):
+            self._output_directory_valid = True
+            self._output_dir_watcher.addPath(self.output_directory)
+    
+    def _restore_last_session(self, config):
+        """Restore the data source and selection saved by the previous session (before service info loads)."""
+        last_data_source = config.get('last_data_source')
+        if last_data_source in self.data_sources and last_data_source != self.current_data_source:
+            # Switch source without triggering on_data_source_changed - load_service_info runs next anyway
+            with QSignalBlocker(self.data_source_combo):
+                self.data_source_combo.setCurrentText(last_data_source)
+            self.current_data_source = last_data_source
+            self.base_url = self.data_sources[last_data_source].url
+            self.service_extent = self.data_sources[last_data_source].default_extent
+            self._update_download_mode_visibility()
+            self._update_attribution()
+        last_selection = config.get('last_selection')
+        if last_selection:
+            try:
+                selection = tuple(float(v) for v in last_selection)
+            except (ValueError, TypeError):
+                selection = None  # Hand-edited or corrupt entry - ignore it, keep the rest of the config
+            if selection is not None and len(selection) == 4:
+                # Restored through the same path as a selection preserved across a data source switch
+                self._pending_selection = selection
+    
+    def _schedule_config_save(self):
+        """Save the config 500 ms after the last change so bursts of changes cost one write."""
+        self._config_save_timer.start()
+    
     def save_config(self):
         """Save configuration to JSON file."""
         try:
             config = {
-                'output_directory': self.output_directory
+                'output_directory': self.output_directory,
+                'last_selection': list(self.selected_bbox) if self.selected_bbox else None,
+                'last_data_source': self.current_data_source,
+                'verbose_log': self._verbose_log
             }
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            if orjson:
+                data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(config, indent=2).encode()
+            # Write to a temp file and rename so an interrupted save never leaves a corrupt config
+            tmp_path = Path(f"{self.config_file}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.config_file)
         except Exception as e:
             # If we can't save config, just continue - it's not critical
             pass
@@ -1606,7 +1859,7 @@ class MainWindow(QMainWindow):
     def select_output_directory(self):
         """Open dialog to select output directory."""
         # Start with current directory or saved directory
-        start_dir = self.output_directory if self.output_directory and os.path.isdir(self.output_directory) else os.getcwd()
+        start_dir = self.output_directory if self._output_directory_valid else os.getcwd()
         
         directory = QFileDialog.getExistingDirectory(
             self,
@@ -1616,9 +1869,9 @@ class MainWindow(QMainWindow):
         )
         
         if directory:
-            self.output_directory = directory
+            self._set_output_directory(directory)
             self.output_dir_edit.setText(directory)
-            self.save_config()  # Save to config file
+            self._schedule_config_save()  # Save to config file
     
     def on_map_first_loaded(self):
         """Handle first successful map load - show instructions and set default bounds."""
@@ -1627,69 +1880,31 @@ class MainWindow(QMainWindow):
         # The map might show a slightly different area due to rounding or basemap coverage,
         # but the box should show the exact bathymetry data bounds from the REST endpoint
         if self.map_widget and self.map_widget.selected_bbox_world is None:
-            if self.service_extent:
+            # Prefer the selection saved by the previous session (still pending until service info loads)
+            default_bbox = self._pending_selection or self.service_extent
+            if default_bbox:
                 # Set default selection to REST endpoint service extent bounds (exact bathymetry data bounds)
                 # This is the correct extent from the REST endpoint, not the map's displayed extent
-                self.map_widget.selected_bbox_world = self.service_extent
+                self.map_widget.selected_bbox_world = default_bbox
                 self.map_widget.set_selection_validity(True)
-                self.selected_bbox = self.service_extent
+                self.selected_bbox = default_bbox
                 # Ensure service_extent is stored in map widget (this is the REST endpoint extent)
                 self.map_widget.service_extent = self.service_extent
                 
                 # CRITICAL: Zoom to the REST endpoint bounds using zoom_to_selection
                 # This ensures the map extent is recalculated with padding and the box is positioned correctly
                 # This mimics what happens when the user hits return in a coordinate field
-                QTimer.singleShot(300, lambda: self.zoom_to_selection(*self.service_extent))
-                self.log_message("Default selection set to service extent bounds, will zoom to dataset bounds")
+                QTimer.singleShot(300, lambda: self.zoom_to_selection(*default_bbox))
+                if default_bbox is self.service_extent:
+                    self.log_message("Default selection set to service extent bounds, will zoom to dataset bounds")
+                else:
+                    self.log_message(f"Restored last session selection, will zoom to it: {default_bbox}")
         # Show map interaction instructions once when map first loads (in orange)
         self.log_message(
             "Map tips — Pan: middle mouse button + drag. Zoom: mouse wheel. Select Area of Interest: left mouse button + drag.",
             color="orange"
         )
     
-    def _zoom_to_service_extent(self):
-        """Zoom to service extent bounds - helper method for delayed zoom."""
-        if self.map_widget and self.service_extent:
-            # Ensure the selected bbox is set to service extent (this is the dataset bounds)
-            self.map_widget.selected_bbox_world = self.service_extent
-            self.map_widget.set_selection_validity(True)
-            self.selected_bbox = self.service_extent
-            # Ensure service extent is stored in map widget for color distinction
-            self.map_widget.service_extent = self.service_extent
-            
-            # Zoom to the service extent - this will reload the map with the correct extent
-            self.zoom_to_selection(*self.service_extent)
-            # After zoom completes, the map will reload and the box should be visible
-            # The box will be repainted in paintEvent when the new map loads
-        
-        instructions = [
-            "",
-            "=" * 60,
-            "Map loaded successfully!",
-            "=" * 60,
-            "",
-            "To select an area:",
-            "  1. Click and drag with the left mouse button on the map",
-            "  2. The selected area will be shown with a purple dashed box",
-            "  3. You can also manually enter coordinates in the West/South/East/North (GCS) fields",
-            "",
-            "To download the selected area:",
-            "  1. Select an area on the map (or enter coordinates)",
-            "  2. For GEBCO 2025, choose Combined Bathymetry && Land, Bathymetry Only, Land Only, Direct Measurements Only, or Direct && Unknown Measurement Only if needed",
-            "  3. Click 'Download Selected Area' button",
-            "  4. Choose a filename and location (defaults to selected directory)",
-            "",
-            "Map controls:",
-            "  - Mouse wheel: Zoom in/out (centered on window)",
-            "  - Middle mouse button + drag: Pan the map",
-            "  - Left mouse button + drag: Select area",
-            "",
-            "=" * 60
-        ]
-        
-        for line in instructions:
-            self.log_message(line)
-    
     def _bboxes_overlap(self, bbox1, bbox2):
         """Check if two bounding boxes overlap.
         
@@ -1712,17 +1927,17 @@ class MainWindow(QMainWindow):
             return
         
         # Get new data source extent
-        new_service_extent = self.data_sources[data_source_name]["default_extent"]
+        new_service_extent = self.data_sources[data_source_name].default_extent
         
         # Always preserve the selected area when switching data sources
         saved_selection = None
-        if hasattr(self, 'selected_bbox') and self.selected_bbox:
+        if self.selected_bbox:
             # Keep the selection regardless of overlap with new data source
             saved_selection = self.selected_bbox
         
         # Update current data source
         self.current_data_source = data_source_name
-        self.base_url = self.data_sources[data_source_name]["url"]
+        self.base_url = self.data_sources[data_source_name].url
         self.service_extent = new_service_extent
         
         # Set flag to force highest resolution when cell size options are updated
@@ -1731,8 +1946,8 @@ class MainWindow(QMainWindow):
         # Update map widget settings if it exists
         if self.map_widget:
             # Update raster functions
-            new_raster_function = self.data_sources[data_source_name]["bathymetry_raster_function"]
-            new_hillshade_raster_function = self.data_sources[data_source_name]["hillshade_raster_function"]
+            new_raster_function = self.data_sources[data_source_name].bathymetry_raster_function
+            new_hillshade_raster_function = self.data_sources[data_source_name].hillshade_raster_function
             self.map_widget.raster_function = new_raster_function
             self.map_widget.hillshade_raster_function = new_hillshade_raster_function
             self.map_widget.base_url = self.base_url
@@ -1747,15 +1962,17 @@ class MainWindow(QMainWindow):
         # Update attribution text
         self._update_attribution()
         
-        # Reload service info (this will update extent and reload map)
-        self.load_service_info()
-        
         # Store selection to restore after map loads (will zoom to it if it overlaps)
+        # Set before load_service_info, which applies prefetched service info immediately
         self._pending_selection = saved_selection
+        
+        # Reload service info (this will update extent and reload map)
+        self.load_service_info()
+        self._schedule_config_save()  # Remember the data source for the next launch
     
     def _update_download_mode_visibility(self):
         """Show Output Data Types groupbox only when GEBCO 2025 (not TID) is selected."""
-        if hasattr(self, 'output_data_types_group'):
+        if self.output_data_types_group is not None:
             is_gebco_2025_not_tid = (
                 self.current_data_source == "GEBCO 2025"
             )
@@ -1763,12 +1980,12 @@ class MainWindow(QMainWindow):
     
     def _update_attribution(self):
         """Update the attribution text based on the current data source."""
-        if not hasattr(self, 'attribution_label'):
+        if self.attribution_label is None:
             return
         
-        ds = self.data_sources.get(self.current_data_source, {})
-        attribution_text = ds.get("attribution", "")
-        attribution_url = ds.get("attribution_url", "")
+        ds = self.data_sources[self.current_data_source]
+        attribution_text = ds.attribution
+        attribution_url = ds.attribution_url
         
         if attribution_text:
             self.attribution_label.setText(attribution_text)
@@ -1781,7 +1998,7 @@ class MainWindow(QMainWindow):
     
     def _open_attribution_url(self):
         """Open the attribution URL in the default web browser."""
-        if hasattr(self, '_current_attribution_url') and self._current_attribution_url:
+        if self._current_attribution_url:
             QDesktopServices.openUrl(QUrl(self._current_attribution_url))
     
     def _reload_map_with_selection(self):
@@ -1789,17 +2006,16 @@ class MainWindow(QMainWindow):
         # If there's a pending selection, let zoom_to_selection handle loading the map
         # Otherwise, load the map with current extent
         if self.map_widget:
-            if hasattr(self, '_pending_selection') and self._pending_selection:
-                # Wait a moment for map widget to be ready, then restore selection
-                # zoom_to_selection will load the map with the correct extent
-                QTimer.singleShot(100, lambda: self._restore_selection())
+            if self._pending_selection:
+                # zoom_to_selection inside _restore_selection does the single load_map for the new extent
+                self._restore_selection()
             else:
                 # No selection - just reload the map with current extent
                 self.map_widget.load_map()
     
     def _restore_selection(self):
         """Restore a previously saved selection and zoom to it."""
-        if hasattr(self, '_pending_selection') and self._pending_selection:
+        if self._pending_selection:
             bbox = self._pending_selection
             self.selected_bbox = bbox
             
@@ -8,20 +8,139 @@ All rights reserved.
 See LICENSE file for full license text.
 """
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton
-from PyQt6.QtCore import Qt, QRect, QPoint, QThread, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, QRect, QPoint, QThread, pyqtSignal, QSize, QTimer
 from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QPixmap, QImage
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import BytesIO
 from PIL import Image
-import numpy as np
 import math
-import pyproj
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from collections import OrderedDict
+
+# Diagnostics go to the module logger; debug output (including pixel sampling) only runs when enabled
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())  # Silent unless the application configures logging
 
 # Web Mercator constants for tile math (EPSG:3857)
 _WEB_MERCATOR_HALF = 20037508.34
 _TILE_SIZE = 256
 
 
+# Retry throttled requests (429/503, honouring Retry-After) and failed connects with backoff (0.3 s, 0.6 s, ...)
+# so a busy tile server doesn't leave gray tiles. Read timeouts are not retried (they are already slow), and
+# after the last retry the response is returned so raise_for_status() reports it as before.
+_RETRY = Retry(total=3, read=0, backoff_factor=0.3, status_forcelist=(429, 503), raise_on_status=False)
+
+# Shared by all loader threads so map reloads (pan, zoom, resize) reuse warm keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=_RETRY))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=_RETRY))
+
+
+# Basemap tiles are fetched and decoded concurrently on this pool (shared so stopped loaders don't leak threads)
+_TILE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="basemap-tile")
+
+
+# Decoded basemap tiles keyed by (base_url, level, row, col), least recently used first. 256 RGB tiles are ~50 MB,
+# enough to cover several viewports so panning back and re-zooming paste from memory.
+_TILE_CACHE = OrderedDict()
+_TILE_CACHE_MAX = 256
+_tile_cache_lock = threading.Lock()
+# Tiles being downloaded right now, so overlapping loads (rapid pans) wait for one fetch instead of repeating it
+_TILE_INFLIGHT = {}
+
+
+def _fetch_basemap_tile(base_url, level, row, col):
+    """Return one basemap tile as an RGB image from the cache or the tile endpoint (runs on _TILE_POOL).
+    Returns None if it could not be loaded; failures are not cached so the next reload retries."""
+    key = (base_url, level, row, col)  # base_url keeps tiles of different tile services apart
+    with _tile_cache_lock:
+        tile_img = _TILE_CACHE.get(key)
+        if tile_img is not None:
+            _TILE_CACHE.move_to_end(key)
+            return tile_img
+        inflight = _TILE_INFLIGHT.get(key)
+        if inflight is None:
+            _TILE_INFLIGHT[key] = Future()
+    if inflight is not None:
+        return inflight.result()
+    tile_img = None
+    try:
+        resp = _SESSION.get(f"{base_url}/tile/{level}/{row}/{col}", timeout=15)
+        resp.raise_for_status()
+        tile_img = Image.open(BytesIO(resp.content))
+        # World Imagery tiles are RGB JPEGs - decode in place rather than through a convert() copy
+        if tile_img.mode == "RGB":
+            tile_img.load()
+        else:
+            tile_img = tile_img.convert("RGB")
+    except Exception:
+        tile_img = None
+    finally:
+        with _tile_cache_lock:
+            if tile_img is not None:
+                _TILE_CACHE[key] = tile_img
+                if len(_TILE_CACHE) > _TILE_CACHE_MAX:
+                    _TILE_CACHE.popitem(last=False)
+            _TILE_INFLIGHT.pop(key).set_result(tile_img)
+    return tile_img
+
+
+# Sphere radius of Web Mercator (EPSG:3857); _WEB_MERCATOR_HALF = pi * _WEB_MERCATOR_RADIUS
+_WEB_MERCATOR_RADIUS = 6378137.0
+
+
+def _transform_to_3857(lons, lats):
+    """Transform GCS lon/lat sequences to Web Mercator x/y tuples.
+    EPSG:3857 is the spherical Mercator formula, so it is computed directly instead of through pyproj.
+    Latitudes must already be clamped to +/-85.0511 (the poles are infinite in 3857)."""
+    xs = tuple(_WEB_MERCATOR_RADIUS * math.radians(lon) for lon in lons)
+    ys = tuple(_WEB_MERCATOR_RADIUS * math.log(math.tan(math.pi / 4 + math.radians(lat) / 2)) for lat in lats)
+    return xs, ys
+
+
+def _read_content(response, cancelled):
+    """Read a streamed response body in chunks; None (connection closed) if cancelled() becomes true first."""
+    chunks = []
+    for chunk in response.iter_content(65536):
+        if cancelled():
+            response.close()
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _extents_equal(a, b, eps=1e-9, tol=0.0):
+    """Return True if two (xmin, ymin, xmax, ymax) extents match within a relative tolerance (or tol map units)."""
+    if not a or not b or len(a) != len(b):
+        return False
+    return all(abs(x - y) <= max(tol, eps * max(1.0, abs(x), abs(y))) for x, y in zip(a, b))
+
+
+def _pil_to_qimage(img):
+    """Convert a decoded PIL image to an RGB (or RGBA, keeping transparency) QImage that owns its pixels."""
+    # Only convert other modes - convert() on an RGB/RGBA image would allocate and copy it again
+    if img.mode == "RGBA":
+        fmt, channels = QImage.Format.Format_RGBA8888, 4
+    else:
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        fmt, channels = QImage.Format.Format_RGB888, 3
+    width, height = img.size
+    data = img.tobytes()
+    # copy() so the QImage owns its pixels once data goes out of scope
+    return QImage(data, width, height, channels * width, fmt).copy()
+
+
+def _pil_to_pixmap(img):
+    """Convert a decoded PIL image to a QPixmap through a QImage (no PNG re-encode)."""
+    return QPixmap.fromImage(_pil_to_qimage(img))
+
+
 class BasemapLoader(QThread):
     """Load World Imagery basemap by fetching and compositing tiles from the tile endpoint.
     View extent is in GCS (4326); tiles are in Web Mercator (3857) scheme."""
@@ -41,9 +160,7 @@ class BasemapLoader(QThread):
             lat_limit = 85.0511287798066
             south_c = max(south, -lat_limit)
             north_c = min(north, lat_limit)
-            tr = pyproj.Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
-            xmin, ymin = tr.transform(west, south_c)
-            xmax, ymax = tr.transform(east, north_c)
+            (xmin, xmax), (ymin, ymax) = _transform_to_3857((west, east), (south_c, north_c))
             # Choose level so that we need ~width/256 tiles (one tile ≈ 256 view pixels)
             extent_merc_width = xmax - xmin
             if extent_merc_width <= 0:
@@ -67,25 +184,26 @@ class BasemapLoader(QThread):
             cols = col_max - col_min + 1
             rows = row_max - row_min + 1
             composite = Image.new("RGB", (int(cols * _TILE_SIZE), int(rows * _TILE_SIZE)), (128, 128, 128))
-            for r in range(row_min, row_max + 1):
-                for c in range(col_min, col_max + 1):
-                    url = f"{self.base_url}/tile/{level}/{r}/{c}"
-                    try:
-                        resp = requests.get(url, timeout=15)
-                        resp.raise_for_status()
-                        tile_img = Image.open(BytesIO(resp.content)).convert("RGB")
-                        composite.paste(tile_img, ((c - col_min) * _TILE_SIZE, (r - row_min) * _TILE_SIZE))
-                    except Exception:
-                        pass
-            composite = composite.resize((width, height), Image.Resampling.LANCZOS)
-            img_bytes = BytesIO()
-            composite.save(img_bytes, format="PNG")
-            img_bytes.seek(0)
-            pixmap = QPixmap()
-            pixmap.loadFromData(img_bytes.getvalue(), "PNG")
-            self.tileLoaded.emit(pixmap)
+            # Fetch all tiles concurrently; paste here in grid order (missing tiles stay gray)
+            tiles = [(r, c) for r in range(row_min, row_max + 1) for c in range(col_min, col_max + 1)]
+            futures = [_TILE_POOL.submit(_fetch_basemap_tile, self.base_url, level, r, c) for r, c in tiles]
+            for (r, c), future in zip(tiles, futures):
+                if self.isInterruptionRequested():
+                    # Superseded by a newer load - drop tiles not started yet (running ones still fill the cache)
+                    for pending in futures:
+                        pending.cancel()
+                    return
+                tile_img = future.result()
+                if tile_img is not None:
+                    composite.paste(tile_img, ((c - col_min) * _TILE_SIZE, (r - row_min) * _TILE_SIZE))
+            # Scale the tile grid to the view with Qt's smooth (bilinear) scaling - much cheaper than a
+            # LANCZOS resample and indistinguishable under the bathymetry overlay
+            image = _pil_to_qimage(composite).scaled(
+                width, height, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation
+            )
+            self.tileLoaded.emit(QPixmap.fromImage(image))
         except Exception as e:
-            print(f"Error loading basemap tiles: {e}")
+            _log.warning("Error loading basemap tiles: %s", e)
             self.tileLoaded.emit(QPixmap())
 
 
@@ -106,7 +224,7 @@ class MapTileLoader(QThread):
             xmin, ymin, xmax, ymax = self.bbox
             width, height = self.size
             
-            print(f"Loading map tile: bbox=({xmin:.2f}, {ymin:.2f}, {xmax:.2f}, {ymax:.2f}), size={width}x{height}")
+            _log.debug("Loading map tile: bbox=(%.2f, %.2f, %.2f, %.2f), size=%dx%d", xmin, ymin, xmax, ymax, width, height)
             
             # Build export URL
             url = f"{self.base_url}/exportImage"
@@ -122,70 +240,50 @@ class MapTileLoader(QThread):
                 import json
                 rendering_rule = {"rasterFunction": self.raster_function}
                 params["renderingRule"] = json.dumps(rendering_rule)
-                print(f"Using raster function: {self.raster_function}")
+                _log.debug("Using raster function: %s", self.raster_function)
             
-            # Build full URL for debugging
-            from urllib.parse import urlencode
-            full_url = f"{url}?{urlencode(params)}"
-            print(f"Full URL: {full_url}")
-            print(f"Requesting: {url} with params: {params}")
+            if _log.isEnabledFor(logging.DEBUG):
+                # Build full URL for debugging
+                from urllib.parse import urlencode
+                _log.debug("Full URL: %s?%s", url, urlencode(params))
+                _log.debug("Requesting: %s with params: %s", url, params)
             
             # Request image
-            response = requests.get(url, params=params, timeout=30)
-            print(f"Response status: {response.status_code}")
-            response.raise_for_status()
-            
-            print(f"Response content length: {len(response.content)} bytes")
-            print(f"Response content type: {response.headers.get('Content-Type', 'unknown')}")
-            
-            # Convert to QPixmap - use a more reliable method
-            img = Image.open(BytesIO(response.content))
-            print(f"Image opened: {img.size}, mode: {img.mode}")
+            # Closed on exit, so an error reply hands its pooled connection straight back
+            with _SESSION.get(url, params=params, timeout=30, stream=True) as response:
+                _log.debug("Response status: %s", response.status_code)
+                response.raise_for_status()
+                content = _read_content(response, self.isInterruptionRequested)
+            if content is None:
+                return  # Superseded by a newer load
             
-            # Save to bytes and load directly into QPixmap
-            img_bytes = BytesIO()
-            img.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
+            _log.debug("Response content length: %d bytes", len(content))
+            _log.debug("Response content type: %s", response.headers.get('Content-Type', 'unknown'))
             
-            # Load directly into QPixmap from bytes
+            # The reply is already PNG - let Qt decode it directly
             pixmap = QPixmap()
-            pixmap.loadFromData(img_bytes.getvalue(), 'PNG')
+            pixmap.loadFromData(content)
             
             if pixmap.isNull():
-                # Fallback: convert via RGB array
-                print("Direct load failed, trying array conversion...")
-                img_rgb = img.convert("RGB")
-                img_array = np.array(img_rgb, dtype=np.uint8)
-                height, width, channel = img_array.shape
-                
-                # Ensure array is contiguous and copy the data
-                if not img_array.flags['C_CONTIGUOUS']:
-                    img_array = np.ascontiguousarray(img_array)
-                
-                # Create QImage - need to keep array in scope
-                bytes_per_line = 3 * width
-                q_image = QImage(img_array.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-                # Copy the image to ensure data persists
-                q_image = q_image.copy()
-                pixmap = QPixmap.fromImage(q_image)
+                # Fallback: decode with PIL and convert via RGB array
+                _log.debug("Direct load failed, trying PIL conversion...")
+                pixmap = _pil_to_pixmap(Image.open(BytesIO(content)))
             
-            # Verify pixmap has content
-            if not pixmap.isNull():
+            # Verify pixmap has content (toImage copies the whole pixmap, so only when debugging)
+            if not pixmap.isNull() and _log.isEnabledFor(logging.DEBUG):
                 test_img = pixmap.toImage()
                 if not test_img.isNull():
                     test_color = test_img.pixelColor(pixmap.width()//2, pixmap.height()//2)
-                    print(f"Pixmap center pixel: R={test_color.red()}, G={test_color.green()}, B={test_color.blue()}")
+                    _log.debug("Pixmap center pixel: R=%d, G=%d, B=%d", test_color.red(), test_color.green(), test_color.blue())
             
-            print(f"Created pixmap: {pixmap.width()}x{pixmap.height()}, isNull: {pixmap.isNull()}")
+            _log.debug("Created pixmap: %dx%d, isNull: %s", pixmap.width(), pixmap.height(), pixmap.isNull())
             
-            print("Emitting tileLoaded signal...")
+            _log.debug("Emitting tileLoaded signal...")
             self.tileLoaded.emit(pixmap, xmin, ymin, xmax, ymax)
-            print("tileLoaded signal emitted")
+            _log.debug("tileLoaded signal emitted")
             
         except Exception as e:
-            print(f"Error loading tile: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Error loading tile: %s", e)
             # Emit empty pixmap on error
             self.tileLoaded.emit(QPixmap(), *self.bbox)
 
@@ -222,15 +320,22 @@ class MapServerLoader(QThread):
                 "f": "image",
                 "transparent": "true" if self.transparent else "false",
             }
-            response = None
+            content = None
             for attempt in range(1, self.max_retries + 1):
+                if self.isInterruptionRequested():
+                    return  # Superseded by a newer load
                 try:
-                    response = requests.get(url, params=params, timeout=60)
-                    response.raise_for_status()
+                    # Closed on exit, so a failed attempt releases its pooled connection before the retry
+                    with _SESSION.get(url, params=params, timeout=60, stream=True) as response:
+                        response.raise_for_status()
+                        content = _read_content(response, self.isInterruptionRequested)
+                    if content is None:
+                        return  # Superseded by a newer load
                     break
                 except requests.exceptions.HTTPError as http_err:
                     status_code = getattr(http_err.response, "status_code", None)
-                    is_retryable = status_code in (500, 502, 503, 504)
+                    # 503 is already retried with backoff by the session (_RETRY)
+                    is_retryable = status_code in (500, 502, 504)
                     if is_retryable and attempt < self.max_retries:
                         self.statusMessage.emit(
                             f'<span style="color: orange;">Warning: Map server returned {status_code}. '
@@ -249,25 +354,20 @@ class MapServerLoader(QThread):
                         continue
                     raise
 
-            if response is None:
+            if content is None:
                 raise RuntimeError("Map server request failed without a response.")
 
-            img = Image.open(BytesIO(response.content))
-            img_bytes = BytesIO()
-            img.save(img_bytes, format="PNG")
-            img_bytes.seek(0)
-            pixmap = QPixmap()
-            pixmap.loadFromData(img_bytes.getvalue(), "PNG")
-            if pixmap.isNull():
-                img_rgb = img.convert("RGB")
-                img_array = np.array(img_rgb, dtype=np.uint8)
-                h, w = img_array.shape[:2]
-                bytes_per_line = 3 * w
-                q_image = QImage(img_array.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-                pixmap = QPixmap.fromImage(q_image.copy())
-            self.tileLoaded.emit(pixmap, west, south, east, north)
+            # The reply is already PNG (alpha kept when transparent) - let Qt decode it directly
+            image = QImage()
+            image.loadFromData(content)
+            if image.isNull():
+                image = _pil_to_qimage(Image.open(BytesIO(content)))
+            if not self.transparent and image.hasAlphaChannel():
+                # Opaque layers (the land basemap) are drawn without alpha - drop it here, off the GUI thread
+                image = image.convertToFormat(QImage.Format.Format_RGB888)
+            self.tileLoaded.emit(QPixmap.fromImage(image), west, south, east, north)
         except Exception as e:
-            print(f"MapServerLoader error: {e}")
+            _log.warning("MapServerLoader error: %s", e)
             self.statusMessage.emit(
                 f'<span style="color: orange;">Warning: Map load problem ({e}). Please try again.</span>'
             )
@@ -280,13 +380,16 @@ class MapWidget(QWidget):
     selectionChanged = pyqtSignal(float, float, float, float)  # xmin, ymin, xmax, ymax
     selectionCompleted = pyqtSignal(float, float, float, float)  # xmin, ymin, xmax, ymax - emitted when selection is finished
     mapFirstLoaded = pyqtSignal()  # Emitted when map is successfully loaded for the first time
+    extentChanged = pyqtSignal()  # Emitted when load_map starts loading the current extent
     statusMessage = pyqtSignal(str)  # Emit status/log messages
     
     def set_selection_validity(self, is_valid):
         """Set whether the current selection is within size limits."""
         if self.selection_is_valid != is_valid:
             self.selection_is_valid = is_valid
-            self.update()  # Trigger repaint to update color
+            # While dragging, mouseMoveEvent repaints right after selectionChanged is handled
+            if not self.is_selecting:
+                self.update()  # Trigger repaint to update color
     
     def __init__(self, base_url, initial_extent, parent=None, raster_function="Shaded Relief - Haxby - MD Hillshade 2", show_basemap=True, show_hillshade=True, use_blend=False, hillshade_raster_function="Multidirectional Hillshade 3x", display_url=None, land_display_url=None):
         super().__init__(parent)
@@ -307,7 +410,9 @@ class MapWidget(QWidget):
         self.selection_end = None
         self.is_selecting = False
         self.is_panning = False
-        self.pan_start = None
+        self.pan_start = None  # Screen position the current pan offset is measured from
+        self._pan_start_extent = None  # Extent at pan_start
+        self._pan_world_per_px = None  # (x, y) world units per screen pixel at pan_start
         self.pan_origin = None  # Track original pan start position for drawing pan line
         self.pan_end = None  # Track current pan position for drawing pan line
         self.raster_function = raster_function
@@ -316,9 +421,30 @@ class MapWidget(QWidget):
         self.pixel_size_y = None  # Pixel size in Y direction from service (meters)
         self.map_loaded = False
         self._first_load_complete = False  # Track if first load has completed
-        self._loading = False  # Flag to prevent multiple simultaneous loads
+        self._loading = False  # True while the loaders started by load_map are running
         self._active_loaders = []  # Track active loaders
-        self._load_timer = None  # Timer for debouncing zoom operations
+        self._retired_loaders = set()  # Stopped loaders still finishing their current request
+        self._w2s_key = None  # (extent, width, height) the cached world->screen coefficients were built for
+        self._w2s_coeffs = None  # (sx, ox, sy, oy), see _world_to_screen_coeffs
+        # Pens and colours used by paintEvent and _draw_legend, built once instead of every frame
+        self._pen_green_dash = QPen(QColor(0, 255, 0), 2, Qt.PenStyle.DashLine)  # Valid selection / drag box
+        self._pen_red_dash = QPen(QColor(255, 0, 0), 2, Qt.PenStyle.DashLine)  # Invalid selection / pan line
+        self._pen_legend_border = QPen(QColor(255, 255, 255), 1)
+        self._color_black = QColor(0, 0, 0)
+        self._color_white = QColor(255, 255, 255)
+        self._color_legend_bg = QColor(0, 0, 0, 140)  # Black with 140/255 opacity (~55% opaque)
+        self._legend_pixmap = None  # Pre-rendered legend, see _draw_legend
+        self._background_key = None  # (basemap, hillshade cache keys, width, height) of _background_pixmap
+        self._background_pixmap = None  # Basemap + hillshade composited at widget size, see _background
+        # Debounced load_map for pan/zoom bursts (see _schedule_load); only the last extent is loaded
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(300)
+        self._load_timer.timeout.connect(self._load_if_moved)
+        self._last_load_request = None  # (extent, width, height) of the last load_map request
+        self.loader = None  # Bathymetry (or display layer) loader
+        self.basemap_loader = None  # Basemap / land layer loader
+        self.hillshade_loader = None  # Hillshade layer loader
         self.selected_bbox_world = None  # (west, south, east, north) in GCS (4326)
         self.selection_is_valid = True  # Track if selection is within size limits (True = valid/green, False = too large/red)
         self.service_extent = None  # Store service extent (for reference)
@@ -326,7 +452,11 @@ class MapWidget(QWidget):
         self._original_pixmap_size = None  # Store original pixmap size before scaling for coordinate conversion
         self._scaled_pixmap_size = None  # Store scaled pixmap size (what's actually drawn)
         self._requested_extent = initial_extent  # (west, south, east, north) GCS
-        print(f"MapWidget initialized with raster function: {self.raster_function}, show_basemap: {self.show_basemap}, show_hillshade: {self.show_hillshade}, use_blend: {self.use_blend}")
+        self._last_loaded_extent = None  # Extent of the last successfully loaded map image
+        self._last_loaded_source = None  # Layer settings/size the last successful load was made with
+        self._loading_source = None  # Layer settings/size of the load currently in progress
+        _log.debug("MapWidget initialized with raster function: %s, show_basemap: %s, show_hillshade: %s, use_blend: %s",
+                   self.raster_function, self.show_basemap, self.show_hillshade, self.use_blend)
         
         # Set a smaller minimum size to allow 60/40 split (60% of 1200 = 720px)
         self.setMinimumSize(600, 400)
@@ -335,6 +465,17 @@ class MapWidget(QWidget):
         # Don't load map immediately - wait for widget to be shown and sized
         # The load will be triggered by showEvent or when explicitly called
         
+    def _source_key(self):
+        """Return the layer settings and widget size that determine what load_map fetches."""
+        return (self.base_url, self.display_url, self.land_display_url, self.raster_function,
+                self.hillshade_raster_function, self.show_basemap, self.show_hillshade,
+                self.width(), self.height())
+    
+    def has_loaded_extent(self, extent, tol=0.0):
+        """Return True if the map was last loaded for this extent (each edge within tol) with the current layer settings."""
+        return (self._last_loaded_source == self._source_key()
+                and _extents_equal(self._last_loaded_extent, extent, tol=tol))
+    
     def set_raster_function(self, raster_function):
         """Set the raster function for map display."""
         self.raster_function = raster_function
@@ -343,40 +484,43 @@ class MapWidget(QWidget):
     def showEvent(self, event):
         """Handle widget being shown - trigger map load if not already loaded."""
         super().showEvent(event)
-        print(f"MapWidget showEvent called, map_loaded={self.map_loaded}, size={self.width()}x{self.height()}")
+        _log.debug("MapWidget showEvent called, map_loaded=%s, size=%dx%d", self.map_loaded, self.width(), self.height())
         # Don't auto-load here - let MainWindow control when to load
         # This ensures the REST endpoint extent is available before loading
         # The map will be loaded explicitly by MainWindow after service info loads
         if not self.map_loaded:
-            print("MapWidget showEvent: Waiting for MainWindow to trigger map load after service info loads")
+            _log.debug("MapWidget showEvent: Waiting for MainWindow to trigger map load after service info loads")
             
     def _stop_all_loaders(self):
         """Stop all active loaders."""
         loaders_to_stop = []
-        if hasattr(self, 'loader') and self.loader:
+        if self.loader:
             loaders_to_stop.append(self.loader)
-        if hasattr(self, 'basemap_loader') and self.basemap_loader:
+        if self.basemap_loader:
             loaders_to_stop.append(self.basemap_loader)
-        if hasattr(self, 'hillshade_loader') and self.hillshade_loader:
+        if self.hillshade_loader:
             loaders_to_stop.append(self.hillshade_loader)
         
-        for loader in loaders_to_stop:
-            if loader.isRunning():
-                loader.terminate()
-                loader.wait(500)  # Wait up to 500ms
-                if loader.isRunning():
-                    # Force kill if still running
-                    loader.terminate()
-                    loader.wait(500)
-        
-        # Disconnect all signals to prevent callbacks from dead threads
+        # Disconnect all signals so a superseded loader's result is never applied
         for loader in loaders_to_stop:
             try:
                 loader.tileLoaded.disconnect()
                 loader.finished.disconnect()
-            except:
+                if isinstance(loader, MapServerLoader):
+                    loader.statusMessage.disconnect()
+            except (TypeError, RuntimeError):
+                # TypeError: nothing left to disconnect; RuntimeError: the Qt object is already deleted
                 pass
         
+        # Ask running loaders to stop instead of terminate()-ing them mid-request: they abort at the next
+        # response chunk and close their connection. Keep a reference until they finish, since a QThread
+        # destroyed while running aborts the process.
+        for loader in loaders_to_stop:
+            if loader.isRunning():
+                loader.requestInterruption()
+                self._retired_loaders.add(loader)
+                loader.finished.connect(lambda loader=loader: self._retired_loaders.discard(loader))
+        
         self._active_loaders = []
     
     def _check_all_loaders_finished(self):
@@ -385,26 +529,46 @@ class MapWidget(QWidget):
             return
         
         all_finished = True
-        if hasattr(self, 'loader') and self.loader and self.loader.isRunning():
+        if self.loader and self.loader.isRunning():
             all_finished = False
-        if hasattr(self, 'basemap_loader') and self.basemap_loader and self.basemap_loader.isRunning():
+        if self.basemap_loader and self.basemap_loader.isRunning():
             all_finished = False
-        if hasattr(self, 'hillshade_loader') and self.hillshade_loader and self.hillshade_loader.isRunning():
+        if self.hillshade_loader and self.hillshade_loader.isRunning():
             all_finished = False
         
         if all_finished:
             self._loading = False
     
+    def _schedule_load(self):
+        """Load the map 300 ms after the last pan/zoom step; restarting the timer drops the earlier requests."""
+        self._load_timer.start()
+    
+    def _load_if_moved(self):
+        """Debounced load: skip it when pan/zoom steps ended within a pixel of the last requested view."""
+        last = self._last_load_request
+        if last is not None and last[1:] == (self.width(), self.height()):
+            last_extent = last[0]
+            xmin, ymin, xmax, ymax = self.extent
+            # World size of one screen pixel at the current extent
+            tol_x = (xmax - xmin) / max(self.width(), 1)
+            tol_y = (ymax - ymin) / max(self.height(), 1)
+            if (abs(xmin - last_extent[0]) < tol_x and abs(xmax - last_extent[2]) < tol_x
+                    and abs(ymin - last_extent[1]) < tol_y and abs(ymax - last_extent[3]) < tol_y):
+                _log.debug("Extent is within a pixel of the last load, skipping reload")
+                return
+        self.load_map()
+    
     def load_map(self):
         """Load map for current extent."""
-        # Cancel any pending load timer
-        if self._load_timer:
-            self._load_timer.stop()
-            self._load_timer = None
-        
-        # Prevent multiple simultaneous loads
-        if self._loading:
-            print("load_map() already in progress, skipping...")
+        # Cancel any pending debounced load - this one supersedes it
+        self._load_timer.stop()
+        # Lets the main window re-derive anything that depends on the view (e.g. the download resolution)
+        self.extentChanged.emit()
+        
+        # A repeat request for the view already loading is dropped; a new view (pan/zoom/resize during
+        # a load) supersedes it - the running loaders are interrupted and retired below
+        if self._loading and self._last_load_request == (self.extent, self.width(), self.height()):
+            _log.debug("load_map() already in progress for this view, skipping...")
             return
             
         # Stop all existing loaders first
@@ -415,13 +579,14 @@ class MapWidget(QWidget):
         # Preserve the current extent - we'll use this for the request
         # and restore it after loading to prevent the selection from moving
         requested_extent = self.extent
+        self._last_load_request = (requested_extent, self.width(), self.height())
         
-        print("=" * 50)
-        print("load_map() called!")
-        print(f"Widget visible: {self.isVisible()}")
-        print(f"Widget size: {self.width()}x{self.height()}")
-        print(f"Extent: {self.extent}")
-        print(f"Base URL: {self.base_url}")
+        _log.debug("=" * 50)
+        _log.debug("load_map() called!")
+        _log.debug("Widget visible: %s", self.isVisible())
+        _log.debug("Widget size: %dx%d", self.width(), self.height())
+        _log.debug("Extent: %s", self.extent)
+        _log.debug("Base URL: %s", self.base_url)
         
         # Ensure widget has a valid size
         widget_width = self.width()
@@ -431,9 +596,9 @@ class MapWidget(QWidget):
         if widget_width <= 0 or widget_height <= 0:
             widget_width = 800
             widget_height = 600
-            print(f"Widget has no size yet, using default: {widget_width}x{widget_height}")
+            _log.debug("Widget has no size yet, using default: %dx%d", widget_width, widget_height)
         else:
-            print(f"Widget size: {widget_width}x{widget_height}")
+            _log.debug("Widget size: %dx%d", widget_width, widget_height)
         
         # Use widget size to fill the window completely
         size = (widget_width, widget_height)
@@ -474,7 +639,7 @@ class MapWidget(QWidget):
             # Update raster function if it changed
             if self.raster_function != new_raster_function:
                 msg = f"Updating raster function based on area of interest size ({pixels_x}x{pixels_y} source pixels): {self.raster_function} -> {new_raster_function}"
-                print(msg)
+                _log.debug(msg)
                 # Format message with green color for raster function info
                 green_msg = f'<span style="color: green;">{msg}</span>'
                 self.statusMessage.emit(green_msg)
@@ -496,21 +661,22 @@ class MapWidget(QWidget):
             raster_info_msg = f"Map display using raster function: {self.raster_function} (area of interest: {pixels_x}x{pixels_y} source pixels)"
         else:
             raster_info_msg = f"Map display using raster function: {self.raster_function}"
-        print(raster_info_msg)
+        _log.debug(raster_info_msg)
         # Format message with green color for raster function info
         green_raster_info_msg = f'<span style="color: green;">{raster_info_msg}</span>'
         self.statusMessage.emit(green_raster_info_msg)
         
-        print(f"Starting map load with extent: {requested_extent}, size: {size}")
-        print(f"Using raster function: {self.raster_function}")
+        _log.debug("Starting map load with extent: %s, size: %s", requested_extent, size)
+        _log.debug("Using raster function: %s", self.raster_function)
         
         # Store the requested extent so we can restore it after loading
         self._requested_extent = requested_extent
+        self._loading_source = self._source_key()
         
         # When display_url is set (e.g. GEBCO MapServer), use GCS extent: land basemap + display layer
         if self.display_url:
             if self.land_display_url:
-                print("Loading land basemap (GCS)...")
+                _log.debug("Loading land basemap (GCS)...")
                 # Land layer: opaque (transparent=False) so it's always visible
                 self.basemap_loader = MapServerLoader(self.land_display_url, requested_extent, size, transparent=False)
                 self.basemap_loader.statusMessage.connect(self.statusMessage.emit)
@@ -519,7 +685,7 @@ class MapWidget(QWidget):
                 self.basemap_loader.finished.connect(self._check_all_loaders_finished)
                 self._active_loaders.append(self.basemap_loader)
                 self.basemap_loader.start()
-            print("Loading display layer (GCS)...")
+            _log.debug("Loading display layer (GCS)...")
             # Bathymetry layer: transparent (transparent=True) so land shows through
             self.loader = MapServerLoader(self.display_url, requested_extent, size, transparent=True)
             self.loader.statusMessage.connect(self.statusMessage.emit)
@@ -529,12 +695,12 @@ class MapWidget(QWidget):
             self._active_loaders.append(self.loader)
             self.loader.start()
             self.map_loaded = True
-            print("=" * 50)
+            _log.debug("=" * 50)
             return
         
         # Load basemap if enabled (non-display_url path)
         if self.show_basemap:
-            print("Loading basemap...")
+            _log.debug("Loading basemap...")
             self.basemap_loader = BasemapLoader(requested_extent, size)
             self.basemap_loader.tileLoaded.connect(self.on_basemap_loaded)
             self.basemap_loader.finished.connect(self._check_all_loaders_finished)
@@ -543,7 +709,7 @@ class MapWidget(QWidget):
         
         # Load hillshade layer if enabled (as underlay)
         if self.show_hillshade:
-            print("Loading hillshade layer...")
+            _log.debug("Loading hillshade layer...")
             self.hillshade_loader = MapTileLoader(self.base_url, requested_extent, size, self.hillshade_raster_function)
             self.hillshade_loader.tileLoaded.connect(self.on_hillshade_loaded)
             self.hillshade_loader.finished.connect(self._check_all_loaders_finished)
@@ -551,28 +717,28 @@ class MapWidget(QWidget):
             self.hillshade_loader.start()
         
         # Load bathymetry layer (main layer)
-        print("Creating MapTileLoader...")
+        _log.debug("Creating MapTileLoader...")
         self.loader = MapTileLoader(self.base_url, requested_extent, size, self.raster_function)
-        print("Connecting signals...")
+        _log.debug("Connecting signals...")
         self.loader.tileLoaded.connect(self.on_tile_loaded)
         self.loader.finished.connect(self.on_loader_finished)
         self.loader.finished.connect(self._check_all_loaders_finished)
         self._active_loaders.append(self.loader)
-        print("Starting loader thread...")
+        _log.debug("Starting loader thread...")
         self.loader.start()
-        print(f"Loader thread started, isRunning: {self.loader.isRunning()}")
+        _log.debug("Loader thread started, isRunning: %s", self.loader.isRunning())
         self.map_loaded = True
-        print("=" * 50)
+        _log.debug("=" * 50)
         
     def on_basemap_loaded(self, pixmap):
         """Handle basemap tile loaded."""
         if not pixmap.isNull():
             # Ensure basemap is fully opaque (remove alpha channel if present)
-            # Convert to QImage, then to RGB format to remove transparency
-            qimage = pixmap.toImage()
-            if qimage.hasAlphaChannel():
+            # Convert to QImage, then to RGB format to remove transparency (only when there is alpha -
+            # toImage() copies the whole pixmap, and basemap composites are already RGB)
+            if pixmap.hasAlphaChannel():
                 # Convert to RGB888 format (removes alpha channel, truly opaque)
-                qimage = qimage.convertToFormat(QImage.Format.Format_RGB888)
+                qimage = pixmap.toImage().convertToFormat(QImage.Format.Format_RGB888)
                 pixmap = QPixmap.fromImage(qimage)
             
             widget_size = self.size()
@@ -587,7 +753,7 @@ class MapWidget(QWidget):
                     )
             else:
                 self.basemap_pixmap = pixmap
-            print(f"Basemap loaded: {self.basemap_pixmap.width()}x{self.basemap_pixmap.height()}")
+            _log.debug("Basemap loaded: %dx%d", self.basemap_pixmap.width(), self.basemap_pixmap.height())
             self.update()  # Trigger repaint
             
     def on_hillshade_loaded(self, pixmap, xmin, ymin, xmax, ymax):
@@ -605,23 +771,23 @@ class MapWidget(QWidget):
                     )
             else:
                 self.hillshade_pixmap = pixmap
-            print(f"Hillshade loaded: {self.hillshade_pixmap.width()}x{self.hillshade_pixmap.height()}")
+            _log.debug("Hillshade loaded: %dx%d", self.hillshade_pixmap.width(), self.hillshade_pixmap.height())
             self.update()  # Trigger repaint
         
     def on_loader_finished(self):
         """Handle loader thread finishing."""
         # If we still have an empty pixmap, the load might have failed
         if self.current_pixmap.isNull():
-            print("Warning: Map tile loader finished but no pixmap was loaded")
+            _log.warning("Map tile loader finished but no pixmap was loaded")
         
     def on_tile_loaded(self, pixmap, xmin, ymin, xmax, ymax):
         """Handle loaded tile."""
-        print(f"on_tile_loaded called! pixmap.isNull: {pixmap.isNull()}, size: {pixmap.width()}x{pixmap.height()}")
+        _log.debug("on_tile_loaded called! pixmap.isNull: %s, size: %dx%d", pixmap.isNull(), pixmap.width(), pixmap.height())
         if not pixmap.isNull():
             # Check if pixmap has actual content (not all white/transparent)
-            # Sample a few pixels to verify
-            sample_image = pixmap.toImage()
-            if not sample_image.isNull():
+            # Sample a few pixels to verify (toImage copies the whole pixmap, so only when debugging)
+            sample_image = pixmap.toImage() if _log.isEnabledFor(logging.DEBUG) else None
+            if sample_image is not None and not sample_image.isNull():
                 # Sample a few pixels
                 colors = []
                 for x in [10, pixmap.width()//2, pixmap.width()-10]:
@@ -629,10 +795,10 @@ class MapWidget(QWidget):
                         if x < pixmap.width() and y < pixmap.height():
                             color = sample_image.pixelColor(x, y)
                             colors.append((color.red(), color.green(), color.blue()))
-                print(f"Sample pixel colors: {colors[:3]}...")  # Print first 3
+                _log.debug("Sample pixel colors: %s...", colors[:3])  # Print first 3
             
             widget_size = self.size()
-            print(f"Widget size in on_tile_loaded: {widget_size.width()}x{widget_size.height()}")
+            _log.debug("Widget size in on_tile_loaded: %dx%d", widget_size.width(), widget_size.height())
             
             # Store original pixmap size before any scaling
             # This is needed for accurate world-to-screen coordinate conversion
@@ -647,7 +813,7 @@ class MapWidget(QWidget):
             
             # Don't scale if sizes match - use pixmap directly
             if widget_size.width() == pixmap.width() and widget_size.height() == pixmap.height():
-                print("Pixmap size matches widget, using directly")
+                _log.debug("Pixmap size matches widget, using directly")
                 self.current_pixmap = pixmap
                 # Use widget size for coordinate conversion to maintain consistent visual size
                 # This ensures the selection box doesn't change size when pixmap pixel size changes
@@ -659,13 +825,13 @@ class MapWidget(QWidget):
                     Qt.AspectRatioMode.KeepAspectRatio,
                     Qt.TransformationMode.SmoothTransformation
                 )
-                print(f"Scaled pixmap: {scaled_pixmap.width()}x{scaled_pixmap.height()}")
+                _log.debug("Scaled pixmap: %dx%d", scaled_pixmap.width(), scaled_pixmap.height())
                 self.current_pixmap = scaled_pixmap
                 # Use the scaled size (what's actually drawn) for coordinate conversion
                 self._scaled_pixmap_size = (scaled_pixmap.width(), scaled_pixmap.height())
             else:
                 # Widget not sized yet, use pixmap as-is
-                print("Widget not sized, using pixmap as-is")
+                _log.debug("Widget not sized, using pixmap as-is")
                 self.current_pixmap = pixmap
                 self._scaled_pixmap_size = (pixmap.width(), pixmap.height())  # No scaling
                 
@@ -676,7 +842,7 @@ class MapWidget(QWidget):
             if self._extent_locked:
                 # Extent is locked (during resize) - never change it
                 pass  # Keep current extent unchanged
-            elif hasattr(self, '_requested_extent') and self._requested_extent is not None:
+            elif self._requested_extent is not None:
                 # Restore the extent we requested, not what the server returned
                 # This ensures coordinate conversion uses the correct extent
                 self.extent = self._requested_extent
@@ -686,7 +852,7 @@ class MapWidget(QWidget):
                 # The server's returned extent matches what's actually displayed
                 # However, if we have a _requested_extent set (from initial load), use that instead
                 # to ensure coordinate conversion matches what we intended to display
-                if hasattr(self, '_requested_extent') and self._requested_extent is not None:
+                if self._requested_extent is not None:
                     # Use the requested extent (which should be the service extent)
                     self.extent = self._requested_extent
                     # Keep _requested_extent for consistency
@@ -695,24 +861,22 @@ class MapWidget(QWidget):
                     server_extent = (xmin, ymin, xmax, ymax)
                     self.extent = server_extent
                     self._requested_extent = server_extent
-            print(f"Setting current_pixmap, isNull: {self.current_pixmap.isNull()}, size: {self.current_pixmap.width()}x{self.current_pixmap.height()}")
-            print(f"Calling update() to repaint widget")
+            _log.debug("Setting current_pixmap, isNull: %s, size: %dx%d",
+                       self.current_pixmap.isNull(), self.current_pixmap.width(), self.current_pixmap.height())
+            _log.debug("Calling update() to repaint widget")
             
-            # CRITICAL: Force immediate repaint to ensure selection box is redrawn with new pixmap size
-            # This is especially important during window resize when pixmap size changes
-            # The selection box will be recalculated in paintEvent using the new pixmap size
-            self.update()  # Trigger repaint immediately
-            self.repaint()  # Force immediate repaint
+            # Repaint so the selection box is redrawn with the new pixmap size
+            # (paintEvent recalculates it; update() coalesces with the other layers' repaints
+            # instead of forcing a synchronous paint for every loaded layer)
+            self.update()
             
-            # Also schedule a delayed repaint to ensure box is visible after map loads
-            # This is especially important after zoom operations
+            _log.debug("Map tile loaded successfully: %dx%d", pixmap.width(), pixmap.height())
             if self.selected_bbox_world:
-                from PyQt6.QtCore import QTimer
-                QTimer.singleShot(100, lambda: self.update())
+                _log.debug("Selected bbox exists: %s, will be repainted", self.selected_bbox_world)
             
-            print(f"Map tile loaded successfully: {pixmap.width()}x{pixmap.height()}")
-            if self.selected_bbox_world:
-                print(f"Selected bbox exists: {self.selected_bbox_world}, will be repainted")
+            # Remember what was loaded so identical requests can skip the network fetch
+            self._last_loaded_extent = (xmin, ymin, xmax, ymax)
+            self._last_loaded_source = self._loading_source
             
             # Emit signal on first successful load
             if not self._first_load_complete:
@@ -721,7 +885,7 @@ class MapWidget(QWidget):
                 # The extent at this point matches what's displayed, so coordinate conversion will be accurate
                 self.mapFirstLoaded.emit()
         else:
-            print("Error: Received null pixmap from tile loader")
+            _log.warning("Received null pixmap from tile loader")
             
     def screen_to_world(self, point):
         """Convert screen coordinates to world coordinates."""
@@ -741,7 +905,7 @@ class MapWidget(QWidget):
         # CRITICAL: Always use _requested_extent if available, as it matches what was actually requested and displayed
         # This ensures coordinate conversion is accurate, especially on first load
         # If _requested_extent is not set, use self.extent, but this should only happen before first map load
-        if hasattr(self, '_requested_extent') and self._requested_extent is not None:
+        if self._requested_extent is not None:
             xmin, ymin, xmax, ymax = self._requested_extent
         elif self.extent:
             # Fallback to current extent if _requested_extent not set yet
@@ -755,72 +919,53 @@ class MapWidget(QWidget):
         
         return (world_x, world_y)
         
+    def _world_to_screen_coeffs(self):
+        """Return (sx, ox, sy, oy) mapping world coordinates to widget pixels for the displayed extent, or None.
+        Cached until the extent or the widget size changes, so drawing only does a multiply-add per coordinate."""
+        # Use _requested_extent if available, as it matches what was actually requested and displayed
+        # This ensures coordinate conversion is accurate and consistent with screen_to_world
+        extent = self._requested_extent if self._requested_extent is not None else self.extent
+        if not extent:
+            # No extent available - cannot convert
+            return None
+        key = (extent, self.width(), self.height())
+        if key != self._w2s_key:
+            # The extent is drawn over the whole widget (the pixmap is scaled to fit it, see paintEvent)
+            xmin, ymin, xmax, ymax = extent
+            sx = key[1] / (xmax - xmin) if xmax != xmin else 0.0
+            sy = key[2] / (ymax - ymin) if ymax != ymin else 0.0
+            self._w2s_key = key
+            self._w2s_coeffs = (sx, -xmin * sx, sy, ymax * sy)  # Y is inverted
+        return self._w2s_coeffs
+    
     def world_to_screen(self, world_x, world_y):
         """Convert world coordinates to screen coordinates."""
+        xy = self._world_to_screen_xy(world_x, world_y)
+        return QPoint(*xy) if xy is not None else None
+    
+    def _world_to_screen_xy(self, world_x, world_y):
+        """Convert world coordinates to an (x, y) tuple of screen coordinates, or None."""
         if self.current_pixmap.isNull():
             return None
-        
-        widget_rect = self.rect()
-        widget_width = widget_rect.width()
-        widget_height = widget_rect.height()
-        
-        # CRITICAL FIX: Use widget size for coordinate conversion when pixmap size doesn't match
-        # This ensures the selection box is drawn correctly even when the pixmap hasn't been updated yet
-        # Get the actual pixmap rect (what's actually drawn)
-        pixmap_rect = self.current_pixmap.rect()
-        pixmap_width = pixmap_rect.width()
-        pixmap_height = pixmap_rect.height()
-        
-        # If pixmap size matches widget size, use pixmap size
-        # Otherwise, use widget size (pixmap will be scaled to fit widget)
-        if pixmap_width == widget_width and pixmap_height == widget_height:
-            # Pixmap matches widget - use pixmap size
-            target_width = pixmap_width
-            target_height = pixmap_height
-            x = 0
-            y = 0
-        else:
-            # Pixmap doesn't match widget - use widget size (pixmap will be centered/scaled)
-            # Center the pixmap in the widget (EXACT same logic as in paintEvent)
-            x = (widget_width - pixmap_width) // 2
-            y = (widget_height - pixmap_height) // 2
-            # Use widget size for coordinate conversion (pixmap will be scaled to fit)
-            target_width = widget_width
-            target_height = widget_height
-            x = 0
-            y = 0
-        
-        # Create the target rect that matches paintEvent exactly
-        target_rect = QRect(x, y, target_width, target_height)
-        
-        # Use _requested_extent if available, as it matches what was actually requested and displayed
-        # This ensures coordinate conversion is accurate and consistent with screen_to_world
-        if hasattr(self, '_requested_extent') and self._requested_extent is not None:
-            xmin, ymin, xmax, ymax = self._requested_extent
-        elif self.extent:
-            # Fallback to current extent if _requested_extent not set yet
-            xmin, ymin, xmax, ymax = self.extent
-        else:
-            # No extent available - cannot convert
+        coeffs = self._world_to_screen_coeffs()
+        if coeffs is None:
             return None
-        
-        # Calculate relative position within the extent (0.0 to 1.0)
-        # This is independent of pixmap size - it's purely based on geographic extent
-        rel_x = (world_x - xmin) / (xmax - xmin) if (xmax - xmin) != 0 else 0
-        rel_y = (ymax - world_y) / (ymax - ymin) if (ymax - ymin) != 0 else 0  # Y is inverted
-        
-        # Convert to screen coordinates using the target rect (same as paintEvent)
-        # The target rect represents where the geographic extent is drawn on screen
-        # CRITICAL: This must use the same rect calculation as paintEvent
-        screen_x = target_rect.left() + rel_x * target_rect.width()
-        screen_y = target_rect.top() + rel_y * target_rect.height()
-        
+        sx, ox, sy, oy = coeffs
+        x = int(world_x * sx + ox)
+        y = int(oy - world_y * sy)
         # Clamp coordinates to widget bounds to prevent drawing outside the widget
-        widget_rect = self.rect()
-        clamped_x = max(0, min(int(screen_x), widget_rect.width() - 1))
-        clamped_y = max(0, min(int(screen_y), widget_rect.height() - 1))
-        result = QPoint(clamped_x, clamped_y)
-        return result
+        # (the size is part of the coefficient cache key, so it is read from there)
+        max_x = self._w2s_key[1] - 1
+        max_y = self._w2s_key[2] - 1
+        if x > max_x:
+            x = max_x
+        if x < 0:
+            x = 0
+        if y > max_y:
+            y = max_y
+        if y < 0:
+            y = 0
+        return x, y
         
     def get_selection_bbox(self):
         """Get the bounding box of the current selection in world coordinates."""
@@ -860,35 +1005,15 @@ class MapWidget(QWidget):
             
         xmin, ymin, xmax, ymax = bbox_world
         
-        # Use _requested_extent if available (matches what's displayed), otherwise use extent
-        # This ensures coordinate conversion uses the correct extent
-        conversion_extent = self._requested_extent if (hasattr(self, '_requested_extent') and self._requested_extent is not None) else self.extent
+        # Convert corners to screen coordinates (_world_to_screen_xy uses the displayed extent)
+        top_left = self._world_to_screen_xy(xmin, ymax)
+        bottom_right = self._world_to_screen_xy(xmax, ymin)
         
-        # Use conversion_extent directly for coordinate conversion
-        # Store original values but don't modify self.extent (world_to_screen will use conversion_extent via parameter)
-        original_extent = self.extent
-        original_requested = getattr(self, '_requested_extent', None)
-        
-        # Temporarily set extent for world_to_screen to use
-        self.extent = conversion_extent
-        if not hasattr(self, '_requested_extent'):
-            self._requested_extent = None
-        self._requested_extent = conversion_extent
-        
-        try:
-            # Convert corners to screen coordinates
-            # world_to_screen will use self._requested_extent which we just set to conversion_extent
-            top_left = self.world_to_screen(xmin, ymax)
-            bottom_right = self.world_to_screen(xmax, ymin)
-            
-            if top_left is not None and bottom_right is not None:
-                screen_rect = QRect(top_left, bottom_right)
-                return screen_rect
-        finally:
-            # Restore original extent
-            self.extent = original_extent
-            if hasattr(self, '_requested_extent'):
-                self._requested_extent = original_requested
+        if top_left is not None and bottom_right is not None:
+            # Same rect as QRect(QPoint, QPoint): both corners are inclusive
+            x1, y1 = top_left
+            x2, y2 = bottom_right
+            return QRect(x1, y1, x2 - x1 + 1, y2 - y1 + 1)
         
         return None
         
@@ -905,38 +1030,56 @@ class MapWidget(QWidget):
         elif event.button() == Qt.MouseButton.MiddleButton:
             # Middle button for panning
             self.is_panning = True
-            self.pan_start = event.position().toPoint()
+            self._anchor_pan(event.position().toPoint())
             self.pan_origin = event.position().toPoint()  # Store original position for pan line
             self.pan_end = event.position().toPoint()  # Initialize pan_end
             self.update()
             
+    def _anchor_pan(self, pos):
+        """Start measuring the pan from pos and the current extent."""
+        self.pan_start = pos
+        self._pan_start_extent = self.extent
+        pixmap_rect = self.current_pixmap.rect()
+        if pixmap_rect.isNull():
+            self._pan_world_per_px = None
+        else:
+            xmin, ymin, xmax, ymax = self.extent
+            self._pan_world_per_px = ((xmax - xmin) / pixmap_rect.width(),
+                                      (ymax - ymin) / pixmap_rect.height())
+            
     def mouseMoveEvent(self, event):
         """Handle mouse move for selection or panning."""
         if self.is_selecting:
-            self.selection_end = event.position().toPoint()
+            end = event.position().toPoint()
+            if end == self.selection_end:
+                return  # Sub-pixel move: same rectangle, skip the coordinate update and repaint
+            # Only the drag box changes - repaint the area of the old and new box, not the whole map
+            dirty = QRect(self.selection_start, end).normalized()
+            if self.selection_end is not None:
+                dirty = dirty.united(QRect(self.selection_start, self.selection_end).normalized())
+            self.selection_end = end
             bbox = self.get_selection_bbox()
             if bbox:
                 self.selectionChanged.emit(*bbox)
-            self.update()
+            self.update(dirty.adjusted(-2, -2, 2, 2))  # Margin for the 2px pen
         elif self.is_panning and self.pan_start:
             # Calculate pan delta
             current_pos = event.position().toPoint()
             self.pan_end = current_pos  # Track current position for pan line
+            if self._pan_world_per_px is None:
+                # No map was shown when the pan started - anchor on the first move after it appears
+                self._anchor_pan(current_pos)
+            # Whole-pixel offset from the pan anchor, so rounding doesn't build up over a long drag
             delta = current_pos - self.pan_start
             
-            # Convert screen delta to world delta
-            pixmap_rect = self.current_pixmap.rect()
-            pixmap_rect.moveCenter(self.rect().center())
-            
-            if not pixmap_rect.isNull():
-                xmin, ymin, xmax, ymax = self.extent
-                world_width = xmax - xmin
-                world_height = ymax - ymin
-                
-                rel_delta_x = -delta.x() / pixmap_rect.width() * world_width
-                rel_delta_y = delta.y() / pixmap_rect.height() * world_height
+            if self._pan_world_per_px is not None:
+                # Convert screen delta to world delta
+                world_per_px_x, world_per_px_y = self._pan_world_per_px
+                rel_delta_x = -delta.x() * world_per_px_x
+                rel_delta_y = delta.y() * world_per_px_y
                 
                 # Update extent
+                xmin, ymin, xmax, ymax = self._pan_start_extent
                 self.extent = (
                     xmin + rel_delta_x,
                     ymin + rel_delta_y,
@@ -945,21 +1088,12 @@ class MapWidget(QWidget):
                 )
                 # Update _requested_extent to match the new extent for accurate coordinate conversion
                 self._requested_extent = self.extent
-                self.pan_start = current_pos
                 self.clear_selection()
                 
                 # Update display to show pan line
                 self.update()
                 
-                # Debounce: Cancel any pending load and schedule a new one after a delay
-                if self._load_timer:
-                    self._load_timer.stop()
-                
-                from PyQt6.QtCore import QTimer
-                self._load_timer = QTimer()
-                self._load_timer.setSingleShot(True)
-                self._load_timer.timeout.connect(self.load_map)
-                self._load_timer.start(300)  # Wait 300ms before loading (debounce)
+                self._schedule_load()
             
     def mouseReleaseEvent(self, event):
         """Handle mouse release for selection or panning."""
@@ -1025,16 +1159,11 @@ class MapWidget(QWidget):
         # Update _requested_extent to match the new extent for accurate coordinate conversion
         self._requested_extent = self.extent
         self.clear_selection()
+        if self.is_panning:
+            # Zoomed mid-drag - measure the rest of the pan from here at the new scale
+            self._anchor_pan(event.position().toPoint())
         
-        # Debounce: Cancel any pending load and schedule a new one after a delay
-        if self._load_timer:
-            self._load_timer.stop()
-        
-        from PyQt6.QtCore import QTimer
-        self._load_timer = QTimer()
-        self._load_timer.setSingleShot(True)
-        self._load_timer.timeout.connect(self.load_map)
-        self._load_timer.start(300)  # Wait 300ms before loading (debounce)
+        self._schedule_load()
         
     def resizeEvent(self, event):
         """Handle widget resize."""
@@ -1043,35 +1172,58 @@ class MapWidget(QWidget):
         # Scaling here interferes with coordinate conversion and causes selection box size issues
         # The map will be reloaded by _refresh_map_on_resize in main.py
             
-    def paintEvent(self, event):
-        """Paint the map and selection rectangle."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
+    def _background(self):
+        """Return the basemap and hillshade layers composited at widget size.
+        Rebuilt only when either layer, its visibility or the widget size changes (see paintEvent)."""
         widget_rect = self.rect()
-        
-        # Draw basemap first (if available) - bottom layer
         # Draw if show_basemap is True OR if land_display_url is set (land layer for GEBCO)
         should_draw_basemap = (self.show_basemap or self.land_display_url) and not self.basemap_pixmap.isNull()
+        should_draw_hillshade = self.show_hillshade and not self.hillshade_pixmap.isNull()
+        key = (self.basemap_pixmap.cacheKey() if should_draw_basemap else None,
+               self.hillshade_pixmap.cacheKey() if should_draw_hillshade else None,
+               widget_rect.width(), widget_rect.height())
+        if key == self._background_key:
+            return self._background_pixmap
+        
+        background = QPixmap(widget_rect.size())
+        if not should_draw_basemap:
+            # Fill background with black if no basemap (nodata areas will show as black)
+            background.fill(self._color_black)
+        elif self.basemap_pixmap.size() != widget_rect.size():
+            # Basemap doesn't cover the widget - leave the margins transparent as before
+            background.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(background)
+        
+        # Draw basemap first (if available) - bottom layer
         if should_draw_basemap:
             basemap_rect = self.basemap_pixmap.rect()
             x = (widget_rect.width() - basemap_rect.width()) // 2
             y = (widget_rect.height() - basemap_rect.height()) // 2
             target_rect = QRect(x, y, basemap_rect.width(), basemap_rect.height())
             painter.drawPixmap(target_rect, self.basemap_pixmap)
-        else:
-            # Fill background with black if no basemap (nodata areas will show as black)
-            painter.fillRect(self.rect(), QColor(0, 0, 0))
         
         # Draw hillshade layer (if available) - middle layer (underlay) at full opacity
-        if self.show_hillshade and not self.hillshade_pixmap.isNull():
+        if should_draw_hillshade:
             hillshade_rect = self.hillshade_pixmap.rect()
             x = (widget_rect.width() - hillshade_rect.width()) // 2
             y = (widget_rect.height() - hillshade_rect.height()) // 2
             target_rect = QRect(x, y, hillshade_rect.width(), hillshade_rect.height())
-            # Ensure full opacity for hillshade (opacity only affects top layer)
-            painter.setOpacity(1.0)
             painter.drawPixmap(target_rect, self.hillshade_pixmap)
+        painter.end()
+        
+        self._background_key = key
+        self._background_pixmap = background
+        return background
+    
+    def paintEvent(self, event):
+        """Paint the map and selection rectangle."""
+        painter = QPainter(self)
+        # No antialiasing: everything here is a pixmap or an axis-aligned rectangle, which AA only blurs
+        
+        widget_rect = self.rect()
+        
+        # Basemap + hillshade are static between loads - draw them from one pre-composited pixmap
+        painter.drawPixmap(0, 0, self._background())
         
         # Draw bathymetry layer on top (with opacity and/or blend mode) - top layer
         # Only this layer uses the opacity setting and blend mode
@@ -1097,16 +1249,19 @@ class MapWidget(QWidget):
             painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
         elif not self.show_basemap:
             # Draw placeholder only if basemap is not shown
-            painter.fillRect(self.rect(), QColor(0, 0, 0))  # Black background
+            painter.fillRect(self.rect(), self._color_black)  # Black background
             status_text = "Loading map..."
-            if hasattr(self, 'loader') and self.loader and self.loader.isRunning():
+            if self.loader and self.loader.isRunning():
                 status_text = "Loading map..."
             else:
                 status_text = "No map data available"
-            painter.setPen(QColor(255, 255, 255))  # White text on black background
+            painter.setPen(self._color_white)  # White text on black background
             painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, status_text)
             
         # Draw selection rectangle (always on top)
+        # Outlines are collected per pen and drawn in one batch each, so the pen changes at most twice
+        green_rects = []  # Drawn with the green dashed pen
+        red_rects = []  # Drawn with the red dashed pen
         # First draw the persistent selected bbox if it exists
         # CRITICAL: Only draw if pixmap is loaded and valid to avoid drawing with stale data during resize
         # Also ensure pixmap size matches widget size (or is being scaled correctly)
@@ -1115,8 +1270,6 @@ class MapWidget(QWidget):
             # Check that pixmap size is reasonable (not stale)
             pixmap_width = self.current_pixmap.width()
             pixmap_height = self.current_pixmap.height()
-            widget_width = self.width()
-            widget_height = self.height()
             
             # Only draw if pixmap dimensions are valid (greater than 0)
             if pixmap_width > 0 and pixmap_height > 0:
@@ -1125,27 +1278,31 @@ class MapWidget(QWidget):
                     # Draw selection rectangle based on validity
                     if self.selection_is_valid:
                         # Valid selection - use green dashed line (no fill)
-                        pen = QPen(QColor(0, 255, 0), 2, Qt.PenStyle.DashLine)  # Green dashed line
+                        green_rects.append(bbox_screen)
                     else:
                         # Selection too large - use red dashed line (no fill)
-                        pen = QPen(QColor(255, 0, 0), 2, Qt.PenStyle.DashLine)  # Red dashed line
-                    painter.setPen(pen)
-                    painter.setBrush(Qt.BrushStyle.NoBrush)  # No fill - outline only
-                    painter.drawRect(bbox_screen)
+                        red_rects.append(bbox_screen)
         
-        # Draw active selection rectangle (while dragging)
+        # Draw active selection rectangle (while dragging) - green dashed line
         if self.show_aoi and self.selection_start and self.selection_end:
-            selection_rect = QRect(self.selection_start, self.selection_end).normalized()
-            pen = QPen(QColor(0, 255, 0), 2, Qt.PenStyle.DashLine)  # Green dashed line
-            painter.setPen(pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)  # No fill - outline only
-            painter.drawRect(selection_rect)
+            green_rects.append(QRect(self.selection_start, self.selection_end).normalized())
         
         # Draw pan line (red line showing pan direction and distance)
-        if self.is_panning and self.pan_origin and self.pan_end:
-            pen = QPen(QColor(255, 0, 0), 2, Qt.PenStyle.DashLine)  # Red dashed line
-            painter.setPen(pen)
-            painter.drawLine(self.pan_origin, self.pan_end)
+        draw_pan_line = self.is_panning and self.pan_origin and self.pan_end
+        
+        painter.setBrush(Qt.BrushStyle.NoBrush)  # No fill - outline only
+        if green_rects:
+            painter.setPen(self._pen_green_dash)
+            painter.drawRects(green_rects)
+        if red_rects or draw_pan_line:
+            painter.setPen(self._pen_red_dash)
+            if red_rects:
+                painter.drawRects(red_rects)
+            if draw_pan_line:
+                # The pan line is usually diagonal - the only shape that benefits from antialiasing
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+                painter.drawLine(self.pan_origin, self.pan_end)
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         
         # Draw legend in upper left corner
         self._draw_legend(painter)
@@ -1155,8 +1312,19 @@ class MapWidget(QWidget):
         if not self.map_loaded or not self.show_legend:
             return  # Don't draw legend until map is loaded or if legend is disabled
         
-        # Legend configuration
+        # The legend never changes, so it is rendered once (again only if the screen's pixel ratio changes)
+        # and blitted on every paint instead of redoing the text layout
+        dpr = self.devicePixelRatioF()
+        if self._legend_pixmap is None or self._legend_pixmap.devicePixelRatioF() != dpr:
+            self._legend_pixmap = self._render_legend(dpr)
+        
+        # Position in upper left corner
         margin = 10
+        painter.drawPixmap(margin, margin, self._legend_pixmap)
+    
+    def _render_legend(self, dpr):
+        """Render the legend into a transparent pixmap at the given device pixel ratio."""
+        # Legend configuration
         padding = 8
         line_height = 20
         line_width = 30
@@ -1168,39 +1336,44 @@ class MapWidget(QWidget):
         # Total: 2*padding + line_height + 4
         legend_height = padding * 2 + line_height + 4
         
-        # Position in upper left corner
-        x = margin
-        y = margin
+        # One extra pixel each way for the right/bottom edge of the border
+        pixmap = QPixmap(math.ceil((legend_width + 1) * dpr), math.ceil((legend_height + 1) * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font())
+        x = 0
+        y = 0
         
         # Draw semi-transparent background
         legend_rect = QRect(x, y, legend_width, legend_height)
-        bg_color = QColor(0, 0, 0, 140)  # Black with 140/255 opacity (~55% opaque)
-        painter.fillRect(legend_rect, bg_color)
+        painter.fillRect(legend_rect, self._color_legend_bg)
         
         # Draw border
-        border_pen = QPen(QColor(255, 255, 255), 1)
-        painter.setPen(border_pen)
+        painter.setPen(self._pen_legend_border)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawRect(legend_rect)
         
         # Draw legend items (Area of Interest)
         items = [
-            (QColor(0, 255, 0), "Area of Interest")
+            (self._pen_green_dash, "Area of Interest")
         ]
         
         start_y = y + padding
-        for i, (color, label) in enumerate(items):
+        for i, (pen, label) in enumerate(items):
             item_y = start_y + i * line_height
             
             # Draw colored line sample (dashed)
             line_x = x + padding
             line_y = item_y + line_height // 2
-            pen = QPen(color, 2, Qt.PenStyle.DashLine)
             painter.setPen(pen)
             painter.drawLine(line_x, line_y, line_x + line_width, line_y)
             
             # Draw label (text baseline at item_y + line_height - 4 to account for text height)
-            painter.setPen(QColor(255, 255, 255))
+            painter.setPen(self._color_white)
             text_x = line_x + line_width + 8
             painter.drawText(text_x, item_y + line_height - 4, label)
+        painter.end()
+        return pixmap
 
@@ -0,0 +1,18 @@
+# PyInstaller hook for pyproj
+# Bundle the PROJ data (proj.db etc.) where pyproj's own datadir discovery looks for it
+# (pyproj/proj_dir/share/proj), so the frozen app needs no PROJ_LIB/PROJ_DATA setup at startup
+import os
+
+from PyInstaller.utils.hooks import collect_data_files
+
+datas = collect_data_files('pyproj', subdir='proj_dir/share/proj')
+
+if not datas:
+    # pyproj installed without bundled data (e.g. conda): copy the active data dir into the same place
+    try:
+        import pyproj.datadir
+        _proj_data_dir = pyproj.datadir.get_data_dir()
+        if _proj_data_dir and os.path.isdir(_proj_data_dir):
+            datas = [(_proj_data_dir, os.path.join('pyproj', 'proj_dir', 'share', 'proj'))]
+    except Exception:
+        datas = []
@@ -0,0 +1,5 @@
+# PyInstaller hook for rasterio
+# Bundle rasterio's own gdal_data and proj_data directories; rasterio points GDAL/PROJ at them itself
+from PyInstaller.utils.hooks import collect_data_files
+
+datas = collect_data_files('rasterio')